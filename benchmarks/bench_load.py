@@ -0,0 +1,203 @@
+"""
+Load benchmarks for granitepy against the local mock andesite node.
+
+Run from the repository root with ``python benchmarks/bench_load.py``. Every benchmark prints one line, so results
+can be compared between revisions.
+"""
+
+import argparse
+import asyncio
+import gc
+import os
+import sys
+import time
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import granitepy  # noqa: E402
+from fake_bot import FakeBot, FakeGuild  # noqa: E402
+from mock_andesite import MockAndesite, make_player_update  # noqa: E402
+
+
+async def close_client(client: granitepy.Client, bot: FakeBot):
+
+    for node in list(client.nodes.values()):
+        # Stop listening first so the closed connection is not handled as a node failure.
+        node.task.cancel()
+        await node.disconnect()
+
+    await bot.close()
+    await client.session.close()
+
+
+async def bench_listen(loop, frames: int):
+    """Measures how many player-update frames per second Node.listen handles."""
+
+    mock = MockAndesite(burst=frames)
+    port = await mock.start()
+
+    bot = FakeBot(loop)
+    client = granitepy.Client(bot, loop=loop)
+    await client.create_node(host="127.0.0.1", port=port, password="mock", identifier="mock")
+
+    # The burst is only read once this coroutine yields, so the player exists before the first frame is handled.
+    client.get_player(FakeGuild(0))
+    start_time = time.perf_counter()
+    await bot.wait_for("node_stats", timeout=600)
+    elapsed = time.perf_counter() - start_time
+
+    await close_client(client, bot)
+    await mock.stop()
+
+    print(f"listen: {frames} frames in {elapsed:.3f}s, {frames / elapsed:,.0f} frames/s")
+
+
+async def bench_compression(loop, frames: int, guilds: int):
+    """Compares the bytes received and the time and CPU used to handle player-update frames with and without compression."""
+
+    for compression in (None, "deflate"):
+
+        mock = MockAndesite(burst=frames, burst_guilds=guilds)
+        port = await mock.start()
+
+        bot = FakeBot(loop)
+        client = granitepy.Client(bot, loop=loop)
+        await client.create_node(host="127.0.0.1", port=port, password="mock", identifier="mock", compression=compression)
+
+        for guild_id in range(guilds):
+            client.get_player(FakeGuild(guild_id))
+        start_time = time.perf_counter()
+        start_cpu = time.process_time()
+        await bot.wait_for("node_stats", timeout=600)
+        cpu = time.process_time() - start_cpu
+        elapsed = time.perf_counter() - start_time
+
+        await close_client(client, bot)
+        await mock.stop()
+
+        # The mock runs in this process, so the CPU time includes compressing the frames as well as reading them.
+        print(f"compression={compression}: {frames} frames, {mock.bytes_sent / frames:,.1f} bytes/frame, "
+              f"{elapsed:.3f}s, {cpu:.3f}s cpu")
+
+
+async def bench_get_tracks(loop, tracks: int, requests: int, concurrency: int):
+    """Measures Node.get_tracks throughput for results of the given size."""
+
+    mock = MockAndesite(tracks=tracks)
+    port = await mock.start()
+
+    bot = FakeBot(loop)
+    client = granitepy.Client(bot, loop=loop)
+    node = await client.create_node(host="127.0.0.1", port=port, password="mock", identifier="mock")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def request(index: int):
+        async with semaphore:
+            await node.get_tracks(f"ytsearch:query {index}")
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*[request(index) for index in range(requests)])
+    elapsed = time.perf_counter() - start_time
+
+    await close_client(client, bot)
+    await mock.stop()
+
+    print(f"get_tracks: {requests} requests of {tracks} tracks in {elapsed:.3f}s, {requests / elapsed:,.0f} requests/s")
+
+
+async def bench_stream_tracks(loop, tracks: int):
+    """Compares the time until the first track is available with Node.get_tracks and Node.stream_tracks."""
+
+    mock = MockAndesite(tracks=tracks)
+    port = await mock.start()
+
+    bot = FakeBot(loop)
+    client = granitepy.Client(bot, loop=loop)
+    node = await client.create_node(host="127.0.0.1", port=port, password="mock", identifier="mock")
+
+    # Warm up the connection and the mock's cached response.
+    await node.get_tracks("playlist:warmup")
+
+    start_time = time.perf_counter()
+    await node.get_tracks("playlist:benchmark")
+    get_tracks_elapsed = time.perf_counter() - start_time
+
+    first_track = None
+    start_time = time.perf_counter()
+    async for _ in node.stream_tracks("playlist:benchmark"):
+        if first_track is None:
+            first_track = time.perf_counter() - start_time
+    stream_elapsed = time.perf_counter() - start_time
+
+    await close_client(client, bot)
+    await mock.stop()
+
+    print(f"stream_tracks: {tracks} tracks, get_tracks {get_tracks_elapsed * 1000:.1f}ms, "
+          f"stream_tracks first track {first_track * 1000:.1f}ms, all {stream_elapsed * 1000:.1f}ms")
+
+
+async def bench_players(loop, player_count: int, lookups: int):
+    """Measures Client.get_player lookup cost and the memory used per Player after its first player update."""
+
+    bot = FakeBot(loop)
+    client = granitepy.Client(bot, loop=loop)
+
+    node = granitepy.Node(client, host="127.0.0.1", port=0, password="mock", identifier="mock")
+    node.available = True
+    client.nodes[node.identifier] = node
+
+    guilds = [FakeGuild(guild_id) for guild_id in range(player_count)]
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+
+    for guild in guilds:
+        player = client.get_player(guild)
+        # Apply one update as it arrives from the websocket, so retained state is part of the measurement.
+        await player.update_state(make_player_update(guild.id)["state"])
+
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    memory = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+    step = max(player_count // lookups, 1)
+    sample = guilds[::step][:lookups]
+    elapsed = timeit.timeit(lambda: [client.get_player(guild) for guild in sample], number=1)
+
+    await bot.close()
+    await client.session.close()
+
+    print(f"players: {player_count} players, {memory / player_count:,.0f} bytes/player, "
+          f"get_player {elapsed / len(sample) * 1e6:,.2f}us/lookup")
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Runs the granitepy load benchmarks.")
+    parser.add_argument("--frames", type=int, default=100000)
+    parser.add_argument("--guilds", type=int, default=1000)
+    parser.add_argument("--tracks", type=int, default=100)
+    parser.add_argument("--playlist", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--players", type=int, nargs="+", default=[10000, 50000, 100000])
+    parser.add_argument("--lookups", type=int, default=1000)
+    args = parser.parse_args()
+
+    loop = asyncio.get_event_loop()
+
+    loop.run_until_complete(bench_listen(loop, args.frames))
+    loop.run_until_complete(bench_compression(loop, args.frames, args.guilds))
+    loop.run_until_complete(bench_get_tracks(loop, args.tracks, args.requests, args.concurrency))
+    loop.run_until_complete(bench_stream_tracks(loop, args.playlist))
+    for player_count in args.players:
+        loop.run_until_complete(bench_players(loop, player_count, args.lookups))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Micro benchmarks for granitepy's hot paths.
+
+Run from the repository root with ``python benchmarks/bench_micro.py``. Results are compared against
+``baselines.json``, and ``--save`` records the current results as the new baselines. Baselines are only comparable
+on the machine they were recorded on.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import granitepy  # noqa: E402
+from fake_bot import FakeBot, FakeGuild  # noqa: E402
+from mock_andesite import make_player_update, make_track  # noqa: E402
+
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+
+class NullWebsocket:
+
+    async def send(self, data: str):
+        pass
+
+
+def make_event(event_type: str):
+
+    return {
+        "op": "event",
+        "type": event_type,
+        "guildId": "0",
+        "userId": "1",
+        "track": make_track(0)["track"],
+        "reason": "FINISHED",
+        "mayStartNext": True,
+        "thresholdMs": 10000,
+        "error": "error",
+        "exception": {"message": "error", "severity": "COMMON"},
+        "code": 4006,
+        "byRemote": True
+    }
+
+
+def setup():
+    """Returns the loop, a connected looking Node and a Player on it."""
+
+    loop = asyncio.get_event_loop()
+    bot = FakeBot(loop)
+    client = granitepy.Client(bot, loop=loop)
+
+    node = granitepy.Node(client, host="127.0.0.1", port=0, password="mock", identifier="mock")
+    node.websocket = NullWebsocket()
+    node.available = True
+    node.writer = loop.create_task(node.write())
+    client.nodes[node.identifier] = node
+
+    player = client.get_player(FakeGuild(0))
+    return loop, node, player
+
+
+def teardown(loop, node):
+    """Stops the Node's writer and closes the Client's session."""
+
+    node.writer.cancel()
+    loop.run_until_complete(asyncio.gather(node.writer, return_exceptions=True))
+    loop.run_until_complete(node.client.session.close())
+
+
+def benchmarks(loop, node, player):
+    """Returns a mapping of benchmark names to the callable to time and the amount of operations per call."""
+
+    tracks = [make_track(index) for index in range(5000)]
+    track_ids = [track["track"] for track in tracks]
+    playlist_info = {"name": "Benchmark", "selectedTrack": None}
+    update = make_player_update(0, position=1000)["state"]
+    events = {event_type: make_event(event_type) for event_type in
+              ("TrackStartEvent", "TrackEndEvent", "TrackStuckEvent", "TrackExceptionEvent", "WebSocketClosedEvent")}
+
+    def run(coroutine_function, count: int):
+        async def runner():
+            for _ in range(count):
+                await coroutine_function()
+        return lambda: loop.run_until_complete(runner())
+
+    cases = {
+        "track_list_5000": (lambda: [granitepy.Track(track_id=track["track"], info=track["info"]) for track in tracks], 5000),
+        "decode_tracks_5000": (lambda: granitepy.decode_tracks(track_ids), 5000),
+        "playlist_5000": (lambda: granitepy.Playlist(playlist_info=playlist_info, tracks=tracks), 5000),
+        "filter_timescale": (lambda: granitepy.Timescale(speed=1.2, pitch=1.1, rate=1).payload, 1),
+        "filter_karaoke": (lambda: granitepy.Karaoke(level=1, mono_level=1, filter_band=220, filter_width=100).payload, 1),
+        "filter_tremolo": (lambda: granitepy.Tremolo(frequency=2, depth=0.5).payload, 1),
+        "filter_vibrato": (lambda: granitepy.Vibrato(frequency=2, depth=0.5).payload, 1),
+        "player_update_state": (run(lambda: player.update_state(update), 1000), 1000),
+        "node_send_play": (run(lambda: node.send(op="play", guildId="0", track=tracks[0]["track"], start=0), 1000), 1000),
+        "node_send_filters": (run(lambda: node.send(op="filters", guildId="0", **granitepy.Timescale(speed=1, pitch=1, rate=1).payload), 1000), 1000)
+    }
+
+    for event_type, data in events.items():
+        cases[f"event_{event_type}"] = (lambda event=getattr(granitepy, event_type), data=data: event(player, data), 1)
+
+    return cases
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Runs the granitepy micro benchmarks.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", action="store_true", help="Record the results as the new baselines.")
+    args = parser.parse_args()
+
+    loop, node, player = setup()
+
+    baselines = {}
+    if os.path.exists(BASELINES):
+        with open(BASELINES) as f:
+            baselines = json.load(f)
+
+    results = {}
+    for name, (function, operations) in benchmarks(loop, node, player).items():
+
+        timer = timeit.Timer(function)
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=args.repeat, number=number)) / number
+
+        results[name] = best / operations * 1e6
+
+        line = f"{name:<32} {results[name]:>10.3f}us/op"
+        if name in baselines:
+            line += f"  {results[name] / baselines[name]:>6.2f}x baseline"
+        print(line)
+
+    teardown(loop, node)
+
+    if args.save:
+        with open(BASELINES, "w") as f:
+            json.dump({name: round(value, 4) for name, value in results.items()}, f, indent=4, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
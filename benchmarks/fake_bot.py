@@ -0,0 +1,94 @@
+"""A minimal stand in for a discord.py bot, providing only what granitepy uses."""
+
+import asyncio
+import collections
+
+
+class FakeUser:
+
+    def __init__(self, user_id: int):
+        self.id = user_id
+        self.bot = True
+
+
+class FakeGuild:
+
+    def __init__(self, guild_id: int, shard_id: int = 0):
+        self.id = guild_id
+        self.shard_id = shard_id
+
+
+class FakeVoiceChannel:
+
+    def __init__(self, channel_id: int, guild: FakeGuild, members: list = None):
+        self.id = channel_id
+        self.guild = guild
+        self.members = members or []
+
+
+class FakeGateway:
+    """Records voice state updates instead of sending them to discord."""
+
+    def __init__(self):
+        self.voice_states = []
+
+    async def voice_state(self, guild_id: int, channel_id, self_mute: bool = False, self_deaf: bool = False):
+        self.voice_states.append((guild_id, channel_id))
+
+
+class FakeConnectionState:
+
+    def __init__(self):
+        self.gateway = FakeGateway()
+        self.parsers = {"VOICE_SERVER_UPDATE": lambda data: None, "VOICE_STATE_UPDATE": lambda data: None}
+
+    def _get_websocket(self, guild_id: int = None, *, shard_id: int = None):
+        return self.gateway
+
+
+class FakeBot:
+    """
+    A fake bot. Dispatched events are counted and can be waited for, and voice state updates are recorded by the
+    fake gateway.
+    """
+
+    def __init__(self, loop=None, user_id: int = 1):
+
+        self.loop = loop if loop else asyncio.get_event_loop()
+        self.user = FakeUser(user_id)
+        self._connection = FakeConnectionState()
+
+        self.dispatched = collections.Counter()
+        self.channels = {}
+        self._waiters = collections.defaultdict(list)
+        self._closed = False
+
+    def add_listener(self, func, name: str):
+        pass
+
+    def dispatch(self, event: str, *args):
+
+        self.dispatched[event] += 1
+
+        for future in self._waiters.pop(event, []):
+            if not future.done():
+                future.set_result(args[0] if len(args) == 1 else args)
+
+    async def wait_for(self, event: str, timeout: float = None):
+
+        future = self.loop.create_future()
+        self._waiters[event].append(future)
+
+        return await asyncio.wait_for(future, timeout=timeout)
+
+    async def wait_until_ready(self):
+        pass
+
+    def is_closed(self):
+        return self._closed
+
+    def get_channel(self, channel_id: int):
+        return self.channels.get(channel_id)
+
+    async def close(self):
+        self._closed = True
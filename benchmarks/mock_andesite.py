@@ -0,0 +1,249 @@
+"""A local fake andesite node used to benchmark granitepy without a real node or discord bot."""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from granitepy.objects import encode_track  # noqa: E402
+
+
+def make_track(index: int):
+    """Returns a loadtracks entry for a fake track."""
+
+    identifier = f"mock{index:08d}"
+    info = {
+        "title": f"Mock Track {index}",
+        "author": "granitepy",
+        "length": 180000 + index,
+        "identifier": identifier,
+        "uri": f"https://example.com/{identifier}",
+        "isStream": index % 50 == 0,
+        "isSeekable": index % 50 != 0,
+        "position": 0
+    }
+
+    return {"track": encode_track(info, source="http"), "info": info}
+
+
+def make_player_update(guild_id: int, position: int = 0):
+    """Returns a player-update frame for a fake player."""
+
+    return {
+        "op": "player-update",
+        "guildId": str(guild_id),
+        "userId": "1",
+        "state": {
+            "time": int(time.time() * 1000),
+            "position": position,
+            "paused": False,
+            "volume": 100,
+            "filters": {}
+        }
+    }
+
+
+def make_stats():
+    """Returns a stats frame."""
+
+    return {
+        "op": "stats",
+        "stats": {
+            "players": {"total": 0, "playing": 0},
+            "cpu": {"andesite": 0.1, "system": 0.2},
+            "frames": {"sent": 3000, "nulled": 0, "deficit": 0}
+        }
+    }
+
+
+class MockAndesite:
+    """
+    A fake andesite node serving the websocket and the ``/loadtracks`` rest endpoint on one port.
+
+    Parameters
+    ----------
+    players: int
+        The amount of fake guilds player-update frames are sent for.
+    update_interval: float
+        The time in seconds between player-update rounds. Every round sends one frame per player.
+    stats_interval: float
+        The time in seconds between stats frames.
+    event_interval: float
+        The time in seconds between TrackEndEvent frames, or None to send no events.
+    burst: int
+        The amount of player-update frames sent as fast as possible after connecting, followed by a stats frame.
+    burst_guilds: int
+        The amount of fake guilds the burst rotates through. Each frame advances the guild's position.
+    tracks: int
+        The amount of tracks returned by ``/loadtracks``.
+
+    ``bytes_sent`` counts the bytes written to websocket connections, after compression.
+    """
+
+    def __init__(self, *, players: int = 0, update_interval: float = 5, stats_interval: float = 60,
+                 event_interval: float = None, burst: int = 0, burst_guilds: int = 1, tracks: int = 10):
+
+        self.players = players
+        self.update_interval = update_interval
+        self.stats_interval = stats_interval
+        self.event_interval = event_interval
+        self.burst = burst
+        self.burst_guilds = burst_guilds
+        self.tracks = tracks
+
+        self.received = []
+        self.bytes_sent = 0
+        self.runner = None
+        self.port = None
+
+        self.app = web.Application()
+        self.app.router.add_get("/websocket", self.websocket_handler)
+        self.app.router.add_get("/loadtracks", self.loadtracks_handler)
+        # Node.rest_uri ends with a slash, andesite treats the resulting double slash like a single one.
+        self.app.router.add_get("//loadtracks", self.loadtracks_handler)
+        self.app.router.add_get("/stats", self.stats_handler)
+
+        self._loadtracks_body = {}
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0):
+        """Starts serving and returns the port, which is chosen by the OS if ``port`` is 0."""
+
+        # Encoded up front to keep the mock off the benchmark's profile.
+        self._burst_frames = [
+            json.dumps(make_player_update(index % self.burst_guilds, position=index // self.burst_guilds * 5000))
+            for index in range(self.burst)
+        ]
+
+        self.runner = web.AppRunner(self.app)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, host, port).start()
+
+        self.port = self.runner.addresses[0][1]
+        return self.port
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+    async def loadtracks_handler(self, request: web.Request):
+
+        identifier = request.query.get("identifier", "")
+        load_type = "PLAYLIST_LOADED" if identifier.startswith("playlist:") else "SEARCH_RESULT"
+
+        # The body only depends on the load type, so it is encoded once to keep the mock off the benchmark's profile.
+        body = self._loadtracks_body.get(load_type)
+        if body is None:
+            body = self._loadtracks_body[load_type] = json.dumps({
+                "loadType": load_type,
+                "playlistInfo": {"name": "Mock Playlist", "selectedTrack": None},
+                "tracks": [make_track(index) for index in range(self.tracks)]
+            })
+
+        return web.Response(text=body, content_type="application/json")
+
+    async def stats_handler(self, request: web.Request):
+        return web.json_response(make_stats()["stats"])
+
+    async def websocket_handler(self, request: web.Request):
+
+        transport = request.transport
+        write = transport.write
+
+        def counting_write(data):
+            self.bytes_sent += len(data)
+            write(data)
+
+        transport.write = counting_write
+
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+
+        await websocket.send_json({"op": "connection-id", "id": "mock-connection"})
+        await websocket.send_json({"op": "metadata", "data": {"version": "mock", "nodeRegion": "local", "nodeId": "mock"}})
+
+        if self.burst:
+            for frame in self._burst_frames:
+                await websocket.send_str(frame)
+            await websocket.send_json(make_stats())
+
+        tasks = [asyncio.ensure_future(self.emit_stats(websocket)), asyncio.ensure_future(self.emit_updates(websocket))]
+        if self.event_interval:
+            tasks.append(asyncio.ensure_future(self.emit_events(websocket)))
+
+        try:
+            async for message in websocket:
+                data = json.loads(message.data)
+                self.received.append(data)
+
+                if data.get("op") == "ping":
+                    await websocket.send_json({"op": "pong"})
+                elif data.get("op") == "get-stats":
+                    await websocket.send_json(make_stats())
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return websocket
+
+    async def emit_stats(self, websocket: web.WebSocketResponse):
+
+        while not websocket.closed:
+            await asyncio.sleep(self.stats_interval)
+            await websocket.send_json(make_stats())
+
+    async def emit_updates(self, websocket: web.WebSocketResponse):
+
+        while not websocket.closed and self.players:
+            for guild_id in range(self.players):
+                await websocket.send_json(make_player_update(guild_id))
+            await asyncio.sleep(self.update_interval)
+
+    async def emit_events(self, websocket: web.WebSocketResponse):
+
+        guild_id = 0
+        while not websocket.closed and self.players:
+            await asyncio.sleep(self.event_interval)
+            await websocket.send_json({
+                "op": "event",
+                "type": "TrackEndEvent",
+                "guildId": str(guild_id),
+                "userId": "1",
+                "track": make_track(guild_id)["track"],
+                "reason": "FINISHED",
+                "mayStartNext": True
+            })
+            guild_id = (guild_id + 1) % self.players
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Runs a fake andesite node.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=2333)
+    parser.add_argument("--players", type=int, default=0)
+    parser.add_argument("--update-interval", type=float, default=5)
+    parser.add_argument("--stats-interval", type=float, default=60)
+    parser.add_argument("--event-interval", type=float, default=None)
+    parser.add_argument("--tracks", type=int, default=10)
+    args = parser.parse_args()
+
+    mock = MockAndesite(players=args.players, update_interval=args.update_interval, stats_interval=args.stats_interval,
+                        event_interval=args.event_interval, tracks=args.tracks)
+
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(mock.start(args.host, args.port))
+    print(f"Mock andesite listening on {args.host}:{args.port}")
+
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        loop.run_until_complete(mock.stop())
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,10 @@ __author__ = "MrRandom#9258 and twitch 🔋#7443"
 from .client import Client
 from .node import Node
 from .player import Player
+from .metrics import Metrics, Collector
+from .registry import Registry, MemoryRegistry, FileRegistry
+from .search import TrackPipeline, TrackCache
+from .tracing import Tracer, Span
 from .exceptions import *
 from .events import *
 from .filters import *
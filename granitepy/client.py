@@ -1,5 +1,10 @@
 import asyncio
+import collections
+import logging
+import os
 import random
+import re
+import time
 import typing
 
 import aiohttp
@@ -7,8 +12,17 @@ import discord
 from discord.ext import commands
 
 from . import exceptions
+from .metrics import Metrics
 from .node import Node
 from .player import Player
+from .registry import Registry
+from .search import TrackCache
+from .tracing import Tracer
+
+log = logging.getLogger(__name__)
+
+# Voice endpoints look like "us-east123.discord.media:443" or "c-fra12-1a2b3c4d.discord.media:443".
+_VOICE_REGION = re.compile(r"^(?:c-)?([a-z]+(?:-[a-z]+)*)")
 
 
 class Client:
@@ -24,17 +38,66 @@ class Client:
         The aiohttp session to use. If none it will create one using the current loop.
     nodes: :class:`dict` [:class:`str`, :class:`.Node`]
         A mapping of Node identifiers to Node instances.
+    shard_affinity: :class:`dict` [:class:`int`, :class:`list` [:class:`str`]]
+        A mapping of shard ids to the identifiers of the Nodes that new Players on that shard should prefer.
+    voice_regions: :class:`dict` [:class:`str`, :class:`str`]
+        A mapping of Discord voice regions to Node regions. Voice regions that are not mapped are matched to Node
+        regions with the same name. See :meth:`set_region`.
+    registry: Optional[:class:`.Registry`]
+        The registry used to share Node load and Player placement with the other processes of a bot cluster.
+        If none nothing is shared. Nodes must use the same identifier in every process.
+    cluster_id: Optional[:class:`str`]
+        The id of this process in the registry. If none it will default to the process id.
+    registry_interval: Optional[:class:`float`]
+        The time in seconds between registry updates.
+    metrics: Optional[:class:`.Metrics`]
+        The metrics implementation granitepy reports to. If none it will default to one that does nothing.
+    tracer: Optional[:class:`.Tracer`]
+        The tracer granitepy reports operations to. If none it will default to one without hooks.
+    track_cache: Optional[:class:`.TrackCache`]
+        The cache used for :meth:`Node.get_tracks` results. If none results are not cached.
+    node_retries: :class:`dict` [:class:`str`, :class:`asyncio.Task`]
+        A mapping of Node identifiers to the tasks retrying Nodes that failed to connect in :meth:`create_nodes`.
+        Cancel a task to stop retrying its Node.
+    cluster_loads: :class:`dict` [:class:`str`, :class:`int`]
+        A mapping of Node identifiers to the amount of Players other processes have on them.
+    cluster_players: :class:`dict` [:class:`int`, :class:`str`]
+        A mapping of :class:`discord.Guild` ids to the identifier of the Node their Player is on in other processes.
+        :meth:`get_player` creates Players for these guilds on the same Node.
+    registry_task: Optional[:class:`asyncio.Task`]
+        The task syncing the registry every :attr:`registry_interval` seconds, if a registry was given.
+        See :meth:`stop_registry`.
     """
 
-    def __init__(self, bot: typing.Union[commands.Bot, commands.AutoShardedBot], loop=None, session=None):
+    def __init__(self, bot: typing.Union[commands.Bot, commands.AutoShardedBot], loop=None, session=None,
+                 registry: Registry = None, cluster_id: str = None, registry_interval: float = 5,
+                 metrics: Metrics = None, tracer: Tracer = None, track_cache: TrackCache = None):
 
         self.bot = bot
         self.loop = loop if loop else asyncio.get_event_loop()
         self.session = session if session else aiohttp.ClientSession(loop=self.loop)
 
         self.nodes = {}
+        self.shard_affinity = {}
+        self.voice_regions = {}
+
+        self.registry = registry
+        self.cluster_id = cluster_id if cluster_id else str(os.getpid())
+        self.registry_interval = registry_interval
+        self.cluster_loads = {}
+        self.cluster_players = {}
+
+        self.reaper = None
+        self._empty_since = {}
+        self.health_checker = None
+        self.node_retries = {}
 
-        self.bot.add_listener(self._update_handler, "on_socket_response")
+        self.metrics = metrics if metrics else Metrics()
+        self.tracer = tracer if tracer else Tracer()
+        self.track_cache = track_cache
+
+        self._hook_voice_parsers()
+        self.registry_task = self.loop.create_task(self._registry_handler()) if registry is not None else None
 
     def __repr__(self):
         return f"<GraniteClient node_count={len(self.nodes.values())} player_count={len(self.players.values())}>"
@@ -49,36 +112,146 @@ class Client:
 
         return {player.guild.id: player for player in players}
 
+    @property
+    def shard_players(self):
+        """:class:`dict` [:class:`int`, :class:`dict` [:class:`int`, :class:`.Player`]]: A mapping of shard ids to the Players of that shard for all Nodes."""
+
+        shards = collections.defaultdict(dict)
+        for node in self.nodes.values():
+            for guild_id, player in node.players.items():
+                shards[player.shard_id][guild_id] = player
+
+        return dict(shards)
+
+    def _hook_voice_parsers(self):
+
+        # noinspection PyProtectedMember
+        parsers = getattr(self.bot._connection, "parsers", None)
+
+        # Fall back to on_socket_response, which is dispatched for every gateway payload, if the parsers are missing.
+        if not parsers or not all(event in parsers for event in ("VOICE_SERVER_UPDATE", "VOICE_STATE_UPDATE")):
+            self.bot.add_listener(self._update_handler, "on_socket_response")
+            return
+
+        for event in ("VOICE_SERVER_UPDATE", "VOICE_STATE_UPDATE"):
+            parsers[event] = self._wrap_voice_parser(event, parsers[event])
+
+    def _wrap_voice_parser(self, event: str, parser: typing.Callable):
+
+        def wrapped_parser(data: dict):
+            parser(data)
+
+            player = self._get_voice_player(event, data)
+            if player is not None:
+                self.loop.create_task(self._voice_update(player, event, data))
+
+        return wrapped_parser
+
+    def _get_voice_player(self, event: str, data: dict):
+
+        if event == "VOICE_STATE_UPDATE" and int(data["user_id"]) != self.bot.user.id:
+            return None
+
+        guild_id = data.get("guild_id")
+        if guild_id is None:
+            return None
+
+        return self._get_player(int(guild_id))
+
+    def _get_player(self, guild_id: int):
+
+        for node in self.nodes.values():
+            player = node.players.get(guild_id)
+            if player is not None:
+                return player
+
+        return None
+
+    async def _voice_update(self, player: Player, event: str, data: dict):
+
+        try:
+            if event == "VOICE_SERVER_UPDATE":
+                await player.voice_server_update(data)
+            else:
+                await player.voice_state_update(data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            # Scheduled from the gateway parser, so nothing else would see the error.
+            log.warning("Handling %s for guild %s failed: %r", event, player.guild.id, error)
+
     async def _update_handler(self, data: dict):
 
-        if not data:
+        if not data or data.get("t") not in ("VOICE_SERVER_UPDATE", "VOICE_STATE_UPDATE"):
             return
 
-        if data["t"] == "VOICE_SERVER_UPDATE":
+        player = self._get_voice_player(data["t"], data["d"])
+        if player is not None:
+            await self._voice_update(player, data["t"], data["d"])
+
+    async def _registry_handler(self):
 
-            guild_id = int(data["d"]["guild_id"])
+        await self.bot.wait_until_ready()
+
+        while not self.bot.is_closed():
             try:
-                player = self.players[guild_id]
-                await player.voice_server_update(data["d"])
-            except KeyError:
-                return
+                await self.sync_registry()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # The last known loads keep being used until the registry recovers.
+                log.exception("Syncing the registry failed.")
 
-        elif data["t"] == "VOICE_STATE_UPDATE":
+            await asyncio.sleep(self.registry_interval)
 
-            if int(data["d"]["user_id"]) != self.bot.user.id:
-                return
+        await self.registry.remove(self.cluster_id)
 
-            guild_id = int(data["d"]["guild_id"])
-            try:
-                player = self.players[guild_id]
-                await player.voice_state_update(data["d"])
-            except KeyError:
-                return
+    async def stop_registry(self):
+        """|coro|
 
-        else:
+        Stops syncing the registry and removes this process from it, so other processes stop counting its load.
+        """
+
+        if self.registry_task is not None:
+            self.registry_task.cancel()
+            self.registry_task = None
+
+        if self.registry is not None:
+            await self.registry.remove(self.cluster_id)
+
+    async def sync_registry(self):
+        """|coro|
+
+        Publishes the Node load and Player placement of this process to the registry and fetches those of the other
+        processes. This is done automatically every :attr:`registry_interval` seconds.
+        """
+
+        if self.registry is None:
             return
 
-    async def create_node(self, host: str, port: int, password: str, identifier: str):
+        snapshot = {
+            "nodes": {identifier: len(node.players) for identifier, node in self.nodes.items()},
+            "players": {str(guild_id): identifier for identifier, node in self.nodes.items() for guild_id in node.players},
+            "time": time.time()
+        }
+        await self.registry.publish(self.cluster_id, snapshot)
+
+        cluster_loads = collections.Counter()
+        cluster_players = {}
+
+        for cluster_id, snapshot in (await self.registry.fetch()).items():
+
+            if cluster_id == self.cluster_id:
+                continue
+
+            cluster_loads.update(snapshot["nodes"])
+            cluster_players.update({int(guild_id): identifier for guild_id, identifier in snapshot["players"].items()})
+
+        self.cluster_loads = dict(cluster_loads)
+        self.cluster_players = cluster_players
+
+    async def create_node(self, host: str, port: int, password: str, identifier: str, player_update_interval: float = 0,
+                          region: str = None, send_queue_size: int = 1000, **websocket_options):
         """|coro|
 
         Creates and returns a :class:`.Node`.
@@ -93,6 +266,19 @@ class Client:
             The password used to authenticate connection to the andesite node.
         identifier: :class:`str`
             A custom identifier for this Node. This must be unique to this Node.
+        player_update_interval: Optional[:class:`float`]
+            The minimum time in seconds between player updates handled for each Player on this Node.
+        region: Optional[:class:`str`]
+            The region of the andesite node. If none it will default to the region the node reports in its metadata.
+        send_queue_size: Optional[:class:`int`]
+            The maximum amount of frames queued to be sent to the andesite node. Once it is reached, sending waits
+            for space. Voice handshakes, stops and destroys are not limited.
+        **websocket_options
+            ``compression``, ``max_size``, ``max_queue``, ``read_limit``, ``write_limit``, ``ping_interval`` and
+            ``ping_timeout`` for the Node's websocket. See :attr:`.Node.websocket_options`.
+
+            Andesite frames are JSON and compress well, so keep the default ``compression="deflate"`` for remote
+            nodes. Setting it to None saves CPU time for nodes on the same host.
 
         Raises
         -----
@@ -110,13 +296,142 @@ class Client:
         if identifier in self.nodes.keys():
             raise exceptions.NodeCreationError(f"A Node with identifier '{identifier}' already exists.")
 
-        node = Node(client=self, host=host, port=port, password=password, identifier=identifier)
+        node = Node(client=self, host=host, port=port, password=password, identifier=identifier,
+                    player_update_interval=player_update_interval, region=region,
+                    send_queue_size=send_queue_size, **websocket_options)
         return await node.connect()
 
-    def get_node(self):
+    async def create_nodes(self, nodes: typing.Iterable[dict], *, timeout: float = 10, retry: bool = True,
+                           retry_delay: float = 5, max_retry_delay: float = 300):
+        """|coro|
+
+        Creates and connects multiple :class:`.Node`'s at the same time.
+
+        Each Node is usable as soon as it connects, so Players can be created while slower Nodes are still connecting.
+        Nodes that fail are retried in the background with an increasing delay, see :attr:`node_retries`.
+        ``granitepy_node_connect`` is dispatched with the Node when a retry succeeds.
+
+        .. code-block:: python3
+
+            nodes, failures = await client.create_nodes([
+                {"host": "127.0.0.1", "port": 5000, "password": "password", "identifier": "main"},
+                {"host": "10.0.0.2", "port": 5000, "password": "password", "identifier": "backup", "region": "eu"}
+            ])
+
+        Parameters
+        ----------
+        nodes: Iterable[:class:`dict`]
+            The keyword arguments for :meth:`create_node` of each Node.
+        timeout: Optional[:class:`float`]
+            The time in seconds each Node has to connect.
+        retry: Optional[:class:`bool`]
+            Whether or not to keep retrying Nodes that failed to connect in the background.
+        retry_delay: Optional[:class:`float`]
+            The time in seconds before the first retry. It doubles after every failed retry.
+        max_retry_delay: Optional[:class:`float`]
+            The maximum time in seconds between retries.
+
+        Returns
+        -------
+        Tuple[:class:`list` [:class:`.Node`], :class:`dict` [:class:`str`, :class:`Exception`]]
+            The Nodes that connected, and a mapping of the identifiers of the Nodes that failed to the error raised.
+        """
+
+        nodes = list(nodes)
+
+        # Waited for once here, so it does not count towards the timeout of every Node.
+        await self.bot.wait_until_ready()
+
+        # create_node only sees Nodes that finished connecting, so duplicates within this call are checked here.
+        identifiers = collections.Counter(node["identifier"] for node in nodes)
+
+        async def connect(node: dict):
+            if identifiers[node["identifier"]] > 1:
+                raise exceptions.NodeCreationError(f"The identifier '{node['identifier']}' is used by multiple Nodes.")
+            return await self._connect_node(node, timeout)
+
+        results = await asyncio.gather(*[connect(node) for node in nodes], return_exceptions=True)
+
+        connected = []
+        failures = {}
+        for node, result in zip(nodes, results):
+
+            if isinstance(result, Node):
+                connected.append(result)
+                continue
+
+            identifier = node["identifier"]
+            failures[identifier] = result
+
+            if retry and not isinstance(result, exceptions.NodeCreationError) and identifier not in self.node_retries:
+                self.node_retries[identifier] = self.loop.create_task(
+                    self._retry_node(node, timeout, retry_delay, max_retry_delay))
+
+        return connected, failures
+
+    async def _connect_node(self, node: dict, timeout: float):
+
+        identifier = node["identifier"]
+
+        # websockets waits for the connection to close when a handshake is cancelled, which can take longer than the
+        # timeout itself, so the connection is left to clean up in the background instead of using wait_for.
+        task = self.loop.create_task(self.create_node(**node))
+        try:
+            await asyncio.wait([task], timeout=timeout)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+
+        if not task.done():
+            task.cancel()
+            self.metrics.inc("granitepy_node_connect_failures_total", node=identifier)
+            raise exceptions.NodeConnectionFailure(f"The Node '{identifier}' timed out while connecting.")
+
+        try:
+            return task.result()
+        except OSError as error:
+            self.metrics.inc("granitepy_node_connect_failures_total", node=identifier)
+            raise exceptions.NodeConnectionFailure(f"The Node '{identifier}' failed to connect: {error}")
+        except exceptions.NodeConnectionFailure:
+            self.metrics.inc("granitepy_node_connect_failures_total", node=identifier)
+            raise
+
+    async def _retry_node(self, node: dict, timeout: float, delay: float, max_delay: float):
+
+        try:
+            while True:
+                await asyncio.sleep(delay)
+
+                try:
+                    connected = await self._connect_node(node, timeout)
+                except asyncio.CancelledError:
+                    raise
+                except exceptions.NodeCreationError:
+                    # The Node was created by other means in the meantime.
+                    return
+                except Exception as error:
+                    log.warning("Retrying Node '%s' failed: %r", node["identifier"], error)
+                    delay = min(delay * 2, max_delay)
+                    continue
+
+                self.bot.dispatch("granitepy_node_connect", connected)
+                return
+        finally:
+            self.node_retries.pop(node["identifier"], None)
+
+    def get_node(self, shard_id: int = None, region: str = None):
         """
         Finds the best :class:`.Node` and returns it.
 
+        Parameters
+        ----------
+        shard_id: Optional[:class:`int`]
+            The shard the Node will be used for. Nodes set in :attr:`shard_affinity` for this shard are preferred,
+            otherwise the available Node with the least Players across the cluster is chosen.
+        region: Optional[:class:`str`]
+            The Node region the Node will be used for, as returned by :meth:`get_region`. Nodes in this region are
+            preferred over Nodes in other regions.
+
         Raises
         ------
         :exc:`.NoNodesAvailable`
@@ -131,13 +446,453 @@ class Client:
         if not self.nodes:
             raise exceptions.NoNodesAvailable("There are no Nodes available.")
 
-        # TODO better method of getting nodes.
-        return random.choice([node for node in self.nodes.values()])
+        available = [node for node in self.nodes.values() if node.available and not node.draining]
+
+        # Unhealthy Nodes are only used when there is nothing else to choose from.
+        candidates = [node for node in available if node.healthy] or available
+        if not candidates:
+            raise exceptions.NoNodesAvailable("There are no Nodes available.")
+
+        preferred = self.shard_affinity.get(shard_id, [])
+        nodes = [node for node in candidates if node.identifier in preferred] or candidates
+
+        if region is not None:
+            nodes = [node for node in nodes if node.region == region] or nodes
+
+        # Pick the Node with the least Players across the whole cluster.
+        loads = {node.identifier: len(node.players) + self.cluster_loads.get(node.identifier, 0) for node in nodes}
+        lowest = min(loads.values())
+
+        return random.choice([node for node in nodes if loads[node.identifier] == lowest])
+
+    def set_shard_affinity(self, shard_id: int, *identifiers: str):
+        """
+        Sets the Nodes that new Players on the given shard should be created on. If none of the Nodes are available,
+        any Node will be used. Passing no identifiers removes the affinity.
+
+        Parameters
+        ----------
+        shard_id: :class:`int`
+            The id of the shard.
+        *identifiers: :class:`str`
+            The identifiers of the preferred Nodes.
+        """
+
+        if identifiers:
+            self.shard_affinity[shard_id] = list(identifiers)
+        else:
+            self.shard_affinity.pop(shard_id, None)
+
+    def set_region(self, region: str, *voice_regions: str):
+        """
+        Maps Discord voice regions to a Node region, for Node regions that are named differently than Discord's.
+
+        Parameters
+        ----------
+        region: :class:`str`
+            The Node region, as set on :class:`.Node` or reported in its :class:`.Metadata`.
+        *voice_regions: :class:`str`
+            The Discord voice regions, such as ``us-east`` or ``rotterdam``, that should use Nodes in this region.
+        """
+
+        for voice_region in voice_regions:
+            self.voice_regions[voice_region] = region
+
+    def get_region(self, endpoint: str):
+        """
+        Returns the Node region for a Discord voice endpoint.
+
+        Parameters
+        ----------
+        endpoint: :class:`str`
+            The voice endpoint from a voice server update, such as ``us-east123.discord.media:443``.
+
+        Returns
+        -------
+        Optional[:class:`str`]
+            The Node region, or None if the endpoint could not be parsed.
+        """
+
+        if not endpoint:
+            return None
+
+        match = _VOICE_REGION.match(endpoint.lower())
+        if match is None:
+            return None
+
+        voice_region = match.group(1)
+        return self.voice_regions.get(voice_region, voice_region)
+
+    def get_shard_stats(self, shard_id: int):
+        """
+        Returns stats about the Players of the given shard.
+
+        Parameters
+        ----------
+        shard_id: :class:`int`
+            The id of the shard.
+
+        Returns
+        -------
+        :class:`dict`
+            The amount of ``players``, ``connected``, ``playing`` and ``paused`` Players of the shard, and a mapping
+            of Node identifiers to the amount of the shard's Players on that Node as ``nodes``.
+        """
+
+        players = self.shard_players.get(shard_id, {}).values()
+
+        return {
+            "players": len(players),
+            "connected": len([player for player in players if player.is_connected]),
+            "playing": len([player for player in players if player.is_playing]),
+            "paused": len([player for player in players if player.is_paused]),
+            "nodes": dict(collections.Counter(player.node.identifier for player in players))
+        }
+
+    async def bulk(self, operation: typing.Callable[[Player], typing.Awaitable],
+                   predicate: typing.Callable[[Player], bool] = None, *, concurrency: int = 10):
+        """|coro|
+
+        Runs an operation on every :class:`.Player` matching the predicate. Players are grouped by Node and every
+        Node runs its operations at the same time, with at most ``concurrency`` in flight per Node. A failing Player
+        does not stop the others.
+
+        .. code-block:: python3
+
+            failures = await client.bulk(lambda player: player.set_volume(50), lambda player: player.volume > 50)
+
+        Parameters
+        ----------
+        operation: Callable[[:class:`.Player`], Awaitable]
+            Called with each Player, returning the awaitable to run.
+        predicate: Optional[Callable[[:class:`.Player`], :class:`bool`]]
+            Called with each Player, returning whether or not to run the operation on it. If none it runs on all Players.
+        concurrency: Optional[:class:`int`]
+            The amount of operations run at the same time on each Node.
+
+        Returns
+        -------
+        :class:`dict` [:class:`int`, :class:`Exception`]
+            A mapping of :class:`discord.Guild` ids to the error raised for Players that failed.
+        """
+
+        failures = {}
+
+        async def run(player: Player, semaphore: asyncio.Semaphore):
+            async with semaphore:
+                try:
+                    await operation(player)
+                except Exception as error:
+                    failures[player.guild.id] = error
+                    self.metrics.inc("granitepy_bulk_failures_total", node=player.node.identifier)
+
+        tasks = []
+        for node in list(self.nodes.values()):
+            semaphore = asyncio.Semaphore(concurrency)
+            for player in list(node.players.values()):
+                if predicate is None or predicate(player):
+                    tasks.append(run(player, semaphore))
+
+        await asyncio.gather(*tasks)
+        return failures
+
+    async def pause_shard(self, shard_id: int, pause: bool = True):
+        """|coro|
+
+        Pauses or un-pauses every playing :class:`.Player` of the given shard.
+
+        Parameters
+        ----------
+        shard_id: :class:`int`
+            The id of the shard.
+        pause: Optional[:class:`bool`]
+            Whether or not the Players should be paused.
+
+        Returns
+        -------
+        :class:`dict` [:class:`int`, :class:`Exception`]
+            A mapping of :class:`discord.Guild` ids to the error raised for Players that failed.
+        """
+
+        return await self.bulk(lambda player: player.set_pause(pause),
+                               lambda player: player.shard_id == shard_id and player.is_playing)
+
+    async def resume_shard(self, shard_id: int):
+        """|coro|
+
+        Shortcut for :meth:`Client.pause_shard` with ``pause`` set to False.
+
+        Parameters
+        ----------
+        shard_id: :class:`int`
+            The id of the shard.
+        """
+
+        return await self.pause_shard(shard_id, pause=False)
+
+    async def reconnect(self, voice_channels: typing.Iterable[discord.VoiceChannel] = None, *, rate: int = 1, per: float = 1.0):
+        """|coro|
+
+        Connects a :class:`.Player` to each of the given Voice Channels while spreading the voice state updates over
+        time, so that mass reconnects after a restart or a Node failure do not hit the Discord gateway rate limits.
+
+        Each shard is handled separately and Voice Channels with the most listeners are connected first. The
+        ``granitepy_reconnect_progress`` event is dispatched with the number of completed and total connections
+        after every attempt.
+
+        Parameters
+        ----------
+        voice_channels: Optional[Iterable[:class:`discord.VoiceChannel`]]
+            The Voice Channels to connect to. If none, every Player that currently has a Voice Channel is reconnected.
+        rate: Optional[:class:`int`]
+            The amount of voice state updates that can be sent per shard every ``per`` seconds.
+        per: Optional[:class:`float`]
+            The time window in seconds that ``rate`` applies to.
+
+        Returns
+        -------
+        :class:`dict` [:class:`int`, :class:`Exception`]
+            A mapping of :class:`discord.Guild` ids to the error raised while connecting, for guilds that failed.
+        """
+
+        if voice_channels is None:
+            voice_channels = [player.voice_channel for player in self.players.values() if player.voice_channel]
+
+        shards = collections.defaultdict(list)
+        for voice_channel in voice_channels:
+            shards[voice_channel.guild.shard_id].append(voice_channel)
+
+        total = sum(len(channels) for channels in shards.values())
+        progress = {"completed": 0}
+        failures = {}
+
+        async def reconnect_shard(channels: list):
+
+            channels.sort(key=lambda channel: len([member for member in channel.members if not member.bot]), reverse=True)
+
+            for index, voice_channel in enumerate(channels):
+
+                if index:
+                    await asyncio.sleep(per / rate)
+
+                try:
+                    player = self.get_player(voice_channel.guild)
+                    await player.connect(voice_channel)
+                except Exception as error:
+                    failures[voice_channel.guild.id] = error
+                    self.metrics.inc("granitepy_reconnect_failures_total", shard=voice_channel.guild.shard_id)
+                else:
+                    self.metrics.inc("granitepy_reconnects_total", shard=voice_channel.guild.shard_id)
+
+                progress["completed"] += 1
+                self.bot.dispatch("granitepy_reconnect_progress", progress["completed"], total)
+
+        await asyncio.gather(*[reconnect_shard(channels) for channels in shards.values()])
+        return failures
+
+    def start_reaper(self, *, interval: float = 60, idle_timeout: float = 3600, empty_timeout: float = 300,
+                     batch_size: int = 10, batch_delay: float = 1):
+        """
+        Starts a task that periodically destroys idle :class:`.Player`'s with :meth:`Client.reap_players`.
+        The ``granitepy_player_reap`` event is dispatched with each Player before it is destroyed.
+
+        Parameters
+        ----------
+        interval: Optional[:class:`float`]
+            The time in seconds between checks.
+        idle_timeout: Optional[:class:`float`]
+            The time in seconds a Player can go without playing anything before it is destroyed.
+        empty_timeout: Optional[:class:`float`]
+            The time in seconds a Player can stay in a Voice Channel without listeners, or without a Voice Channel,
+            before it is destroyed.
+        batch_size: Optional[:class:`int`]
+            The amount of Players destroyed at the same time.
+        batch_delay: Optional[:class:`float`]
+            The time in seconds to wait between batches.
+
+        Returns
+        -------
+        :class:`asyncio.Task`
+            The reaper task.
+        """
+
+        self.stop_reaper()
+
+        async def reaper():
+            await self.bot.wait_until_ready()
+
+            while not self.bot.is_closed():
+                await asyncio.sleep(interval)
+                await self.reap_players(idle_timeout=idle_timeout, empty_timeout=empty_timeout,
+                                        batch_size=batch_size, batch_delay=batch_delay)
+
+        self.reaper = self.loop.create_task(reaper())
+        return self.reaper
+
+    def start_health_checks(self, *, interval: float = 30, timeout: float = 10, max_latency: float = None,
+                            max_frame_deficit: int = None, failure_threshold: int = 3, recovery_time: float = 60):
+        """
+        Starts a task that periodically runs :meth:`Node.check_health` on every :class:`.Node`.
+
+        After ``failure_threshold`` failed checks in a row a Node is marked unhealthy and is not used for new Players.
+        It is checked again after ``recovery_time`` seconds and marked healthy once a check passes. The
+        ``granitepy_node_unhealthy`` and ``granitepy_node_healthy`` events are dispatched with the Node when its
+        health changes.
+
+        Parameters
+        ----------
+        interval: Optional[:class:`float`]
+            The time in seconds between checks.
+        timeout: Optional[:class:`float`]
+            The time in seconds the ping and rest probe may take.
+        max_latency: Optional[:class:`float`]
+            The maximum ping round trip time in milliseconds.
+        max_frame_deficit: Optional[:class:`int`]
+            The maximum frame deficit reported in a Node's stats.
+        failure_threshold: Optional[:class:`int`]
+            The amount of failed checks in a row before a Node is marked unhealthy.
+        recovery_time: Optional[:class:`float`]
+            The time in seconds before an unhealthy Node is checked again.
+
+        Returns
+        -------
+        :class:`asyncio.Task`
+            The health check task.
+        """
+
+        self.stop_health_checks()
+
+        async def check(node: Node):
+
+            if not node.healthy and time.time() < node.retry_health_at:
+                return
+
+            if await node.check_health(timeout=timeout, max_latency=max_latency, max_frame_deficit=max_frame_deficit):
+                node.health_failures = 0
+                if not node.healthy:
+                    node.healthy = True
+                    self.bot.dispatch("granitepy_node_healthy", node)
+                return
+
+            node.health_failures += 1
+            self.metrics.inc("granitepy_node_health_failures_total", node=node.identifier)
+
+            if node.healthy and node.health_failures >= failure_threshold:
+                node.healthy = False
+                self.bot.dispatch("granitepy_node_unhealthy", node)
+
+            if not node.healthy:
+                node.retry_health_at = time.time() + recovery_time
+
+        async def health_checker():
+            await self.bot.wait_until_ready()
+
+            while not self.bot.is_closed():
+                await asyncio.gather(*[check(node) for node in list(self.nodes.values()) if node.available])
+                await asyncio.sleep(interval)
+
+        self.health_checker = self.loop.create_task(health_checker())
+        return self.health_checker
+
+    def stop_health_checks(self):
+        """
+        Stops the task started by :meth:`Client.start_health_checks`, if it is running.
+        """
+
+        if self.health_checker is not None:
+            self.health_checker.cancel()
+            self.health_checker = None
+
+    def stop_reaper(self):
+        """
+        Stops the task started by :meth:`Client.start_reaper`, if it is running.
+        """
+
+        if self.reaper is not None:
+            self.reaper.cancel()
+            self.reaper = None
+
+    async def reap_players(self, *, idle_timeout: float = 3600, empty_timeout: float = 300, batch_size: int = 10,
+                           batch_delay: float = 1):
+        """|coro|
+
+        Destroys every :class:`.Player` that has not played anything for ``idle_timeout`` seconds, or that has been
+        in a Voice Channel without listeners, or without a Voice Channel, for ``empty_timeout`` seconds.
+
+        Parameters
+        ----------
+        idle_timeout: Optional[:class:`float`]
+            The time in seconds a Player can go without playing anything before it is destroyed.
+        empty_timeout: Optional[:class:`float`]
+            The time in seconds a Player can stay without listeners before it is destroyed.
+        batch_size: Optional[:class:`int`]
+            The amount of Players destroyed at the same time.
+        batch_delay: Optional[:class:`float`]
+            The time in seconds to wait between batches.
+
+        Returns
+        -------
+        :class:`list` [:class:`.Player`]
+            The Players that were destroyed.
+        """
+
+        now = time.time()
+        players = self.players
+        idle = []
+
+        for guild_id in list(self._empty_since):
+            if guild_id not in players:
+                del self._empty_since[guild_id]
+
+        for guild_id, player in players.items():
+
+            channel = player.voice_channel
+            if channel is None or not any(not member.bot for member in channel.members):
+                empty_since = self._empty_since.setdefault(guild_id, now)
+            else:
+                empty_since = self._empty_since.pop(guild_id, None)
+
+            if empty_since is not None and now - empty_since >= empty_timeout:
+                idle.append(player)
+            elif (not player.is_playing or player.is_paused) and now - player.last_active >= idle_timeout:
+                idle.append(player)
+
+        destroyed = []
+
+        for index in range(0, len(idle), batch_size):
+
+            if index:
+                await asyncio.sleep(batch_delay)
+
+            batch = idle[index:index + batch_size]
+            for player in batch:
+                self.bot.dispatch("granitepy_player_reap", player)
+
+            results = await asyncio.gather(*[player.destroy() for player in batch], return_exceptions=True)
+
+            for player, result in zip(batch, results):
+                self._empty_since.pop(player.guild.id, None)
+                if not isinstance(result, Exception):
+                    destroyed.append(player)
+                    self.metrics.inc("granitepy_players_reaped_total", node=player.node.identifier)
+
+        return destroyed
+
+    def _get_cluster_node(self, guild_id: int):
+
+        node = self.nodes.get(self.cluster_players.get(guild_id))
+        if node is None or not node.available or node.draining or not node.healthy:
+            return None
+
+        return node
 
     def get_player(self, guild: discord.Guild, cls: typing.Type[Player] = None, **kwargs):
         """
         Tries to return the :class:`.Player` for the current :class:`discord.Guild`, If one doesnt exist it will be created.
 
+        A new Player is created on the Node another process of the cluster has the guild's Player on, if it is usable,
+        so a guild that moves between processes keeps its andesite player. Otherwise :meth:`get_node` chooses the Node.
+
         Parameters
         ----------
         guild: :class:`discord.Guild`
@@ -159,14 +914,17 @@ class Client:
         if not self.nodes:
             raise exceptions.NoNodesAvailable("There are no Nodes available.")
 
-        if guild.id in self.players.keys():
-            return self.players[guild.id]
+        player = self._get_player(guild.id)
+        if player is not None:
+            return player
 
         if not cls:
             cls = Player
 
-        node = self.get_node()
+        node = self._get_cluster_node(guild.id) or self.get_node(shard_id=guild.shard_id)
         player = cls(node, guild, **kwargs)
         node.players[guild.id] = player
+        node._report_players()
+        self.metrics.inc("granitepy_players_created_total", node=node.identifier)
 
-        return self.players[guild.id]
+        return player
@@ -1,14 +1,57 @@
+from . import exceptions
+from . import objects
 
 
 class GranitepyEvent:
 
+    __slots__ = ()
+
+    name = "null_event"
+
     def __init__(self):
         pass
 
-    name = "null_event"
 
+class TrackEvent(GranitepyEvent):
+    """
+    Base class for events about a track.
+
+    The track is resolved to the Player's current :class:`.Track` when their ids match. Otherwise it is decoded
+    locally with :func:`.decode_track` when :attr:`track` is first accessed.
 
-class TrackStartEvent(GranitepyEvent):
+    Attributes
+    ----------
+    player: :class:`.Player`
+        The Player relevant to this event.
+    track_id: :class:`str`
+        The base64 encoded id of the track.
+    """
+
+    __slots__ = ("player", "track_id", "_track")
+
+    def __init__(self, player, data):
+        super().__init__()
+
+        self.player = player
+        self.track_id = data["track"]
+
+        current = player.current
+        self._track = current if current is not None and current.track_id == self.track_id else None
+
+    @property
+    def track(self):
+        """:class:`.Track`: The track relevant to this event."""
+
+        if self._track is None:
+            try:
+                self._track = objects.decode_track(self.track_id)
+            except exceptions.TrackDecodeError:
+                self._track = objects.Track(track_id=self.track_id, info={})
+
+        return self._track
+
+
+class TrackStartEvent(TrackEvent):
     """
     Dispatched when a track starts playing.
 
@@ -20,18 +63,16 @@ class TrackStartEvent(GranitepyEvent):
         The name of this event.
     track: :class:`.Track`
         The track that started playing.
+    track_id: :class:`str`
+        The base64 encoded id of the track.
     """
 
-    def __init__(self, player, data):
-        super().__init__()
-
-        self.player = player
-        self.name = "track_start"
+    __slots__ = ()
 
-        self.track = data["track"]
+    name = "track_start"
 
 
-class TrackEndEvent(GranitepyEvent):
+class TrackEndEvent(TrackEvent):
     """
     Dispatched when a track has finished playing.
 
@@ -43,24 +84,26 @@ class TrackEndEvent(GranitepyEvent):
         The name of this event.
     track: :class:`.Track`
         The track that finished playing.
+    track_id: :class:`str`
+        The base64 encoded id of the track.
     reason: :class:`str`
         Why the track has stopped.
     may_start_next: :class:`bool`
         Whether or not a track can play next.
     """
 
-    def __init__(self, player, data):
-        super().__init__()
+    __slots__ = ("reason", "may_start_next")
 
-        self.player = player
-        self.name = "track_end"
+    name = "track_end"
+
+    def __init__(self, player, data):
+        super().__init__(player, data)
 
-        self.track = data["track"]
         self.reason = data["reason"]
         self.may_start_next = data["mayStartNext"]
 
 
-class TrackStuckEvent(GranitepyEvent):
+class TrackStuckEvent(TrackEvent):
     """
     Dispatched when a track gets stuck while playing.
 
@@ -72,17 +115,19 @@ class TrackStuckEvent(GranitepyEvent):
         The name of this event.
     track: :class:`.Track`
         The track that got stuck.
+    track_id: :class:`str`
+        The base64 encoded id of the track.
     threshold: :class:`int`
         Unsure as of right now.
     """
 
-    def __init__(self, player, data):
-        super().__init__()
+    __slots__ = ("threshold",)
 
-        self.player = player
-        self.name = "track_stuck"
+    name = "track_stuck"
+
+    def __init__(self, player, data):
+        super().__init__(player, data)
 
-        self.track = data["track"]
         self.threshold = data["thresholdMs"]
 
 
@@ -102,11 +147,14 @@ class TrackExceptionEvent(GranitepyEvent):
         The exception that was raised.
     """
 
+    __slots__ = ("player", "error", "exception")
+
+    name = "track_exception"
+
     def __init__(self, player, data):
         super().__init__()
 
         self.player = player
-        self.name = "track_exception"
 
         self.error = data["error"]
         self.exception = data["exception"]
@@ -130,11 +178,14 @@ class WebSocketClosedEvent(GranitepyEvent):
         Whether the websocket was closed remotely.
     """
 
+    __slots__ = ("player", "reason", "code", "by_remote")
+
+    name = "websocket_closed"
+
     def __init__(self, player, data):
         super().__init__()
 
         self.player = player
-        self.name = "websocket_closed"
 
         self.reason = data["reason"]
         self.code = data["code"]
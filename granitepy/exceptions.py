@@ -31,6 +31,11 @@ class NoNodesAvailable(GranitepyException):
     pass
 
 
+class PlayerConnectionTimeout(GranitepyException):
+    """The player's voice connection was not completed in time."""
+    pass
+
+
 class TrackInvalidPosition(GranitepyException):
     """An invalid position was chosen for a track."""
     pass
@@ -41,6 +46,11 @@ class TrackLoadError(GranitepyException):
     pass
 
 
+class TrackDecodeError(GranitepyException):
+    """There was an error while decoding or encoding a track."""
+    pass
+
+
 class FilterInvalidArgument(GranitepyException):
     """An invalid argument was passed to a filter."""
     pass
@@ -0,0 +1,140 @@
+import collections
+
+
+class Metrics:
+    """
+    The metrics interface used by granitepy. This implementation does nothing and is the default.
+
+    Subclass this and pass an instance as ``metrics`` to :class:`.Client` to forward granitepy metrics elsewhere.
+    Metric names follow the prometheus conventions, and labels are passed as keyword arguments.
+    """
+
+    def inc(self, name: str, value: float = 1, **labels):
+        """
+        Increments a counter.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the counter.
+        value: Optional[:class:`float`]
+            The amount to increment the counter by.
+        """
+
+    def set(self, name: str, value: float, **labels):
+        """
+        Sets a gauge.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the gauge.
+        value: :class:`float`
+            The new value of the gauge.
+        """
+
+    def observe(self, name: str, value: float, **labels):
+        """
+        Records a value in a histogram.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the histogram.
+        value: :class:`float`
+            The value to record.
+        """
+
+
+class Collector(Metrics):
+    """
+    A :class:`.Metrics` implementation that keeps every metric in memory and can render them in the prometheus
+    text exposition format.
+
+    Attributes
+    ----------
+    buckets: :class:`tuple` [:class:`float`]
+        The upper bounds of the histogram buckets.
+    counters: :class:`dict`
+        A mapping of metric names to a mapping of label tuples to their value.
+    gauges: :class:`dict`
+        A mapping of metric names to a mapping of label tuples to their value.
+    histograms: :class:`dict`
+        A mapping of metric names to a mapping of label tuples to their bucket counts, sum and count.
+    """
+
+    DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+
+        self.buckets = tuple(sorted(buckets))
+
+        self.counters = collections.defaultdict(lambda: collections.defaultdict(float))
+        self.gauges = collections.defaultdict(dict)
+        self.histograms = collections.defaultdict(dict)
+
+    def __repr__(self):
+        return f"<GraniteMetricsCollector metric_count={len(self.counters) + len(self.gauges) + len(self.histograms)}>"
+
+    def inc(self, name: str, value: float = 1, **labels):
+        self.counters[name][tuple(sorted(labels.items()))] += value
+
+    def set(self, name: str, value: float, **labels):
+        self.gauges[name][tuple(sorted(labels.items()))] = value
+
+    def observe(self, name: str, value: float, **labels):
+
+        key = tuple(sorted(labels.items()))
+        histogram = self.histograms[name].get(key)
+
+        if histogram is None:
+            histogram = self.histograms[name][key] = [[0] * len(self.buckets), 0.0, 0]
+
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                histogram[0][index] += 1
+
+        histogram[1] += value
+        histogram[2] += 1
+
+    @staticmethod
+    def _format(name: str, labels: tuple, value: float):
+
+        if labels:
+            label_string = ",".join(f'{key}="{value}"' for key, value in labels)
+            return f"{name}{{{label_string}}} {value}"
+
+        return f"{name} {value}"
+
+    def render(self):
+        """
+        Renders every metric in the prometheus text exposition format.
+
+        Returns
+        -------
+        :class:`str`
+            The rendered metrics.
+        """
+
+        lines = []
+
+        for name, values in sorted(self.counters.items()):
+            lines.append(f"# TYPE {name} counter")
+            lines.extend(self._format(name, labels, value) for labels, value in values.items())
+
+        for name, values in sorted(self.gauges.items()):
+            lines.append(f"# TYPE {name} gauge")
+            lines.extend(self._format(name, labels, value) for labels, value in values.items())
+
+        for name, values in sorted(self.histograms.items()):
+            lines.append(f"# TYPE {name} histogram")
+
+            for labels, (buckets, total, count) in values.items():
+                for bound, bucket_count in zip(self.buckets, buckets):
+                    lines.append(self._format(f"{name}_bucket", labels + (("le", bound),), bucket_count))
+
+                lines.append(self._format(f"{name}_bucket", labels + (("le", "+Inf"),), count))
+                lines.append(self._format(f"{name}_sum", labels, total))
+                lines.append(self._format(f"{name}_count", labels, count))
+
+        return "\n".join(lines) + "\n"
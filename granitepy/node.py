@@ -1,12 +1,319 @@
+import asyncio
+import codecs
+import heapq
+import itertools
 import json
+import re
 import socket
 import time
 
+import aiohttp
 import websockets
 
 from . import events
 from . import exceptions
 from . import objects
+from .search import TrackPipeline, _copy_result
+
+
+class _SendQueue:
+    """
+    The outbound frames of a Node, ordered by priority.
+
+    Voice handshakes, stops, destroys and pings are sent first and are never held back by the size limit. A queued
+    volume update for a guild is replaced by the latest one, queued filter updates are merged per filter type, and
+    stops and destroys drop the queued frames they supersede. Every queued frame has the futures of the
+    :meth:`Node.send` calls waiting on it.
+    """
+
+    URGENT = {"voice-server-update", "stop", "destroy", "ping"}
+    COALESCED = {"volume", "filters"}
+    SUPERSEDES = {
+        "stop": {"play", "seek"},
+        "destroy": {"play", "seek", "pause", "volume", "filters", "stop"}
+    }
+
+    def __init__(self, loop, max_size: int):
+
+        self.loop = loop
+        self.max_size = max_size
+        self.size = 0
+
+        self.heap = []
+        self.counter = itertools.count()
+        self.coalesced = {}
+        self.guilds = {}
+        self.waiters = {}
+        self.error = None
+
+        self.not_empty = asyncio.Event()
+        self.slots = asyncio.Semaphore(max_size)
+
+    def __len__(self):
+        return self.size
+
+    async def put(self, data: dict):
+
+        if self.error is not None:
+            raise self.error
+
+        op = data.get("op")
+        guild_id = data.get("guildId")
+        future = self.loop.create_future()
+
+        urgent = op in self.URGENT
+        if not urgent:
+            if self._merge(op, guild_id, data, future):
+                return future, 1
+
+            # [op, superseded]
+            waiter = [op, False]
+            waiters = self.waiters.setdefault(guild_id, [])
+            waiters.append(waiter)
+            try:
+                await self.slots.acquire()
+            finally:
+                waiters.remove(waiter)
+                if not waiters:
+                    del self.waiters[guild_id]
+
+            if self.error is not None:
+                raise self.error
+
+            # A stop or destroy for this guild, or another frame to merge with, may have been queued while waiting.
+            if waiter[1]:
+                self.slots.release()
+                future.set_result(None)
+                return future, 1
+            if self._merge(op, guild_id, data, future):
+                self.slots.release()
+                return future, 1
+
+        dropped = self._drop(op, guild_id)
+
+        # [priority, sequence, data, futures, dropped]
+        entry = [0 if urgent else 1, next(self.counter), data, [future], False]
+        heapq.heappush(self.heap, entry)
+        self.size += 1
+
+        if guild_id is not None:
+            self.guilds.setdefault(guild_id, []).append(entry)
+            if op in self.COALESCED:
+                self.coalesced[(guild_id, op)] = entry
+
+        self.not_empty.set()
+        return future, dropped
+
+    def _merge(self, op: str, guild_id: str, data: dict, future):
+
+        if op not in self.COALESCED:
+            return False
+
+        entry = self.coalesced.get((guild_id, op))
+        if entry is None:
+            return False
+
+        if op == "filters":
+            # Each frame carries one filter type, so the others queued for the guild have to be kept.
+            entry[2].update(data)
+        else:
+            entry[2] = data
+        entry[3].append(future)
+        return True
+
+    def _drop(self, op: str, guild_id: str):
+
+        superseded = self.SUPERSEDES.get(op)
+        if not superseded or guild_id is None:
+            return 0
+
+        dropped = 0
+        for waiter in self.waiters.get(guild_id, []):
+            if waiter[0] in superseded:
+                waiter[1] = True
+
+        # _remove edits the guild's list, so iterate over a copy.
+        for entry in list(self.guilds.get(guild_id, [])):
+            if entry[4] or entry[2].get("op") not in superseded:
+                continue
+
+            self._remove(entry)
+            for future in entry[3]:
+                if not future.done():
+                    future.set_result(None)
+            dropped += 1
+
+        return dropped
+
+    def _remove(self, entry: list):
+
+        entry[4] = True
+        self.size -= 1
+        if entry[0]:
+            self.slots.release()
+
+        guild_id = entry[2].get("guildId")
+        if guild_id is None:
+            return
+
+        entries = self.guilds[guild_id]
+        entries.remove(entry)
+        if not entries:
+            del self.guilds[guild_id]
+
+        key = (guild_id, entry[2].get("op"))
+        if self.coalesced.get(key) is entry:
+            del self.coalesced[key]
+
+    async def get(self):
+
+        while True:
+            while not self.heap:
+                self.not_empty.clear()
+                await self.not_empty.wait()
+
+            entry = heapq.heappop(self.heap)
+            if entry[4]:
+                continue
+
+            self._remove(entry)
+            return entry[2], entry[3]
+
+    def close(self, error: Exception):
+
+        self.error = error
+
+        # Wake every put waiting for a slot, they raise the error once they see the queue is closed.
+        for waiters in self.waiters.values():
+            for _ in waiters:
+                self.slots.release()
+
+        while self.heap:
+            entry = heapq.heappop(self.heap)
+            if entry[4]:
+                continue
+
+            self._remove(entry)
+            for future in entry[3]:
+                if not future.done():
+                    future.set_exception(error)
+
+
+class _TrackStreamParser:
+    """Incrementally extracts the objects of the top level "tracks" array from a loadtracks response body."""
+
+    SPECIAL = re.compile(r'["\\\[\]{}]')
+    SEPARATORS = re.compile(r"[\s,]*")
+
+    def __init__(self):
+
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.json_decoder = json.JSONDecoder()
+
+        self.buffer = ""
+        self.position = 0
+        self.rest = []
+
+        self.depth = 0
+        self.in_string = False
+        self.in_tracks = False
+        self.string_start = 0
+        self.last_string = None
+
+    def feed(self, chunk: bytes):
+
+        self.buffer += self.decoder.decode(chunk)
+        tracks = []
+
+        while self.position < len(self.buffer):
+            parsed = self._parse_tracks(tracks) if self.in_tracks else self._scan()
+            if not parsed:
+                break
+
+        # Drop the text that has been handled, keeping an unfinished track or string.
+        keep = self.string_start if self.in_string else self.position
+        self.buffer = self.buffer[keep:]
+        self.position -= keep
+        self.string_start -= keep
+
+        return tracks
+
+    def _scan(self):
+
+        buffer = self.buffer
+        skip = 0
+
+        for match in self.SPECIAL.finditer(buffer, self.position):
+
+            index = match.start()
+            if index < skip:
+                continue
+
+            character = buffer[index]
+
+            if self.in_string:
+                if character == "\\":
+                    skip = index + 2
+                elif character == '"':
+                    self.in_string = False
+                    if self.depth == 1:
+                        self.last_string = buffer[self.string_start + 1:index]
+
+            elif character == '"':
+                self.in_string = True
+                self.string_start = index
+
+            elif character == "{" or character == "[":
+                self.depth += 1
+
+                if self.depth == 2 and character == "[" and self.last_string == "tracks":
+                    self.in_tracks = True
+                    self.rest.append(buffer[self.position:index + 1])
+                    self.position = index + 1
+                    return True
+
+            else:
+                self.depth -= 1
+
+        # An escape at the very end of the buffer has to be seen again with the escaped character.
+        end = len(buffer) if skip <= len(buffer) else skip - 2
+        self.rest.append(buffer[self.position:end])
+        self.position = end
+
+        return end == len(buffer)
+
+    def _parse_tracks(self, tracks: list):
+
+        buffer = self.buffer
+
+        while True:
+            position = self.SEPARATORS.match(buffer, self.position).end()
+            if position >= len(buffer):
+                self.position = position
+                return False
+
+            if buffer[position] == "]":
+                self.in_tracks = False
+                self.depth -= 1
+                self.position = position
+                return True
+
+            try:
+                track, self.position = self.json_decoder.raw_decode(buffer, position)
+            except ValueError:
+                # The track has not been fully received yet.
+                self.position = position
+                return False
+
+            tracks.append(track)
+
+    def close(self):
+        """Returns the response without the tracks, which are replaced by an empty array."""
+
+        if self.in_tracks:
+            raise ValueError("The tracks array was not closed.")
+
+        return json.loads("".join(self.rest) + self.buffer[self.position:])
 
 
 class Node:
@@ -33,9 +340,30 @@ class Node:
         The uri of the rest api used to make requests.
     players: :class:`dict` [:class:`int`, :class:`.Player`]
         A mapping of :class:`discord.Guild` ids to Player instances for this Node.
+    player_update_interval: :class:`float`
+        The minimum time in seconds between player updates handled for each Player. Updates that arrive sooner are
+        ignored. Can be overridden per Player with :attr:`.Player.update_interval`.
+    send_queue_size: :class:`int`
+        The maximum amount of frames queued to be sent. Voice handshakes, stops and destroys are not limited.
+    region: Optional[:class:`str`]
+        The region of the andesite node. If none it will default to the region in the node's :class:`.Metadata`.
+    websocket_options: :class:`dict`
+        The keyword arguments passed to :func:`websockets.connect`. Set from the ``compression``, ``max_size``,
+        ``max_queue``, ``read_limit``, ``write_limit``, ``ping_interval`` and ``ping_timeout`` arguments, which are
+        described in websockets' documentation.
+    draining: :class:`bool`
+        Whether or not the Node is being drained by :meth:`Node.drain`. New Players are not created on draining Nodes.
+    healthy: :class:`bool`
+        Whether or not the Node passed its last health check. Unhealthy Nodes are not used for new Players while
+        a healthy Node is available. See :meth:`Client.start_health_checks`.
+    last_stats: Optional[:class:`dict`]
+        The last stats sent by the andesite node.
     """
 
-    def __init__(self, client, host: str, port: int, password: str, identifier: str):
+    def __init__(self, client, host: str, port: int, password: str, identifier: str, player_update_interval: float = 0,
+                 region: str = None, send_queue_size: int = 1000, *, compression: str = "deflate",
+                 max_size: int = 2 ** 20, max_queue: int = 2 ** 5, read_limit: int = 2 ** 16, write_limit: int = 2 ** 16,
+                 ping_interval: float = 20, ping_timeout: float = 20):
 
         self.client = client
         self.bot = client.bot
@@ -48,8 +376,28 @@ class Node:
         self.rest_uri = f"http://{self.host}:{self.port}/"
 
         self.websocket = None
+        self.websocket_options = {
+            "compression": compression,
+            "max_size": max_size,
+            "max_queue": max_queue,
+            "read_limit": read_limit,
+            "write_limit": write_limit,
+            "ping_interval": ping_interval,
+            "ping_timeout": ping_timeout
+        }
         self.available = False
+        self.draining = False
         self.task = None
+        self.writer = None
+
+        self.healthy = True
+        self.health_failures = 0
+        self.retry_health_at = 0
+        self.last_stats = None
+        self.pong = None
+        self.send_queue_size = send_queue_size
+        self.send_queue = _SendQueue(client.loop, send_queue_size)
+        self.sending = False
 
         self.connection_id = None
         self.metadata = None
@@ -61,10 +409,21 @@ class Node:
         }
 
         self.players = {}
+        self.player_update_interval = player_update_interval
+        self._region = region
 
     def __repr__(self):
         return f"<GraniteNode player_count={len(self.players.keys())} available={self.available}>"
 
+    @property
+    def region(self):
+        if self._region is not None:
+            return self._region
+        return self.metadata.node_region if self.metadata else None
+
+    def _report_players(self):
+        self.client.metrics.set("granitepy_players", len(self.players), node=self.identifier)
+
     async def listen(self):
 
         while self.available is True:
@@ -73,6 +432,7 @@ class Node:
                 data = await self.websocket.recv()
 
             except websockets.ConnectionClosed:
+                self.client.metrics.inc("granitepy_node_disconnects_total", node=self.identifier)
                 await self.disconnect()
                 raise exceptions.NodeConnectionClosed(f"The connection to node '{self.identifier}' was closed.")
 
@@ -82,9 +442,14 @@ class Node:
             data = json.loads(data)
 
             op_code = data.get("op")
+            self.client.metrics.inc("granitepy_frames_received_total", op=op_code, node=self.identifier)
+
             if op_code == "pong":
+                if self.pong is not None and not self.pong.done():
+                    self.pong.set_result(time.perf_counter())
                 self.bot.dispatch("node_ping", time.time())
             elif op_code == "stats":
+                self.last_stats = data["stats"]
                 self.bot.dispatch(f"node_stats", data["stats"])
             elif op_code == "metadata":
                 self.metadata = objects.Metadata(data["data"])
@@ -95,38 +460,92 @@ class Node:
             elif op_code == "player-update":
                 try:
                     player = self.players[int(data["guildId"])]
-                    await player.update_state(data["state"])
                 except KeyError:
                     continue
 
+                interval = self.player_update_interval if player.update_interval is None else player.update_interval
+                if interval and time.time() * 1000 - player.last_update < interval * 1000:
+                    continue
+
+                await player.update_state(data["state"])
+
     async def dispatch_event(self, data: dict):
 
+        start_time = time.perf_counter()
+
         try:
             player = self.players[int(data["guildId"])]
         except KeyError:
             return
 
-        event = getattr(events, data["type"], None)
-        event = event(player, data)
+        with self.client.tracer.span("node.dispatch_event", node=self.identifier, guild_id=player.guild.id, event=data["type"]):
+            event = getattr(events, data["type"], None)
+            event = event(player, data)
 
-        self.bot.dispatch(f"granitepy_{event.name}", event)
+            self.bot.dispatch(f"granitepy_{event.name}", event)
+        self.client.metrics.observe("granitepy_event_dispatch_seconds", time.perf_counter() - start_time, event=event.name)
 
     async def send(self, **data):
 
         if not self.available:
             raise exceptions.NodeNotAvailable(f"The node '{self.identifier}' is not currently available.")
 
-        await self.websocket.send(json.dumps(data))
+        guild_id = int(data["guildId"]) if "guildId" in data else None
+        with self.client.tracer.span("node.send", node=self.identifier, guild_id=guild_id, op=data.get("op")):
+
+            # Nothing is waiting, so skip the queue instead of handing the frame to the writer.
+            if not self.sending and not self.send_queue:
+                self.sending = True
+                try:
+                    await self.websocket.send(json.dumps(data))
+                finally:
+                    self.sending = False
+
+                self.client.metrics.inc("granitepy_frames_sent_total", op=data.get("op"), node=self.identifier)
+                return
+
+            future, superseded = await self.send_queue.put(data)
+            self.client.metrics.set("granitepy_send_queue_depth", len(self.send_queue), node=self.identifier)
+            if superseded:
+                self.client.metrics.inc("granitepy_frames_superseded_total", superseded, node=self.identifier)
+
+            await future
+
+    async def write(self):
+
+        while True:
+            data, futures = await self.send_queue.get()
+            self.client.metrics.set("granitepy_send_queue_depth", len(self.send_queue), node=self.identifier)
+
+            self.sending = True
+            try:
+                await self.websocket.send(json.dumps(data))
+            except asyncio.CancelledError:
+                # Only the writer is being cancelled, the callers waiting on this frame see the Node going away.
+                error = exceptions.NodeNotAvailable(f"The node '{self.identifier}' is not currently available.")
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(error)
+                raise
+            except Exception as error:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            finally:
+                self.sending = False
+
+            for future in futures:
+                if not future.done():
+                    future.set_result(None)
+
+            self.client.metrics.inc("granitepy_frames_sent_total", op=data.get("op"), node=self.identifier)
 
     @property
     async def latency(self):
         """:class:`float`: The latency between granitepy and your andesite node."""
 
-        start_time = time.time()
-        await self.send(op="ping")
-        end_time = await self.bot.wait_for(f"node_ping")
-
-        return (end_time - start_time) * 1000
+        return await self.ping()
 
     @property
     async def stats(self):
@@ -137,6 +556,78 @@ class Node:
 
         return node_stats
 
+    async def ping(self, timeout: float = 10):
+        """|coro|
+
+        Sends a ping to the andesite node and waits for its pong.
+
+        Parameters
+        ----------
+        timeout: Optional[:class:`float`]
+            The time in seconds to wait for the pong.
+
+        Raises
+        ------
+        :exc:`asyncio.TimeoutError`
+            The pong did not arrive in time.
+
+        Returns
+        -------
+        :class:`float`
+            The round trip time in milliseconds.
+        """
+
+        if self.pong is None or self.pong.done():
+            self.pong = self.bot.loop.create_future()
+
+        start_time = time.perf_counter()
+        await self.send(op="ping")
+        end_time = await asyncio.wait_for(asyncio.shield(self.pong), timeout=timeout)
+
+        return (end_time - start_time) * 1000
+
+    async def check_health(self, *, timeout: float = 10, max_latency: float = None, max_frame_deficit: int = None):
+        """|coro|
+
+        Checks whether this :class:`.Node` is healthy by pinging its websocket, probing its rest api and comparing
+        its last stats against the given thresholds.
+
+        Parameters
+        ----------
+        timeout: Optional[:class:`float`]
+            The time in seconds the ping and rest probe may take.
+        max_latency: Optional[:class:`float`]
+            The maximum ping round trip time in milliseconds. If none any latency is allowed.
+        max_frame_deficit: Optional[:class:`int`]
+            The maximum frame deficit reported in the Node's stats. If none any deficit is allowed.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether or not the Node is healthy.
+        """
+
+        try:
+            latency = await self.ping(timeout=timeout)
+
+            async with self.client.session.get(url=f"{self.rest_uri}stats", headers={"Authorization": self.password},
+                                               timeout=timeout) as response:
+                if response.status >= 500:
+                    return False
+
+        except (asyncio.TimeoutError, aiohttp.ClientError, exceptions.NodeNotAvailable, websockets.ConnectionClosed):
+            return False
+
+        if max_latency is not None and latency > max_latency:
+            return False
+
+        if max_frame_deficit is not None and self.last_stats:
+            frames = self.last_stats.get("frameStats") or self.last_stats.get("frames") or {}
+            if frames.get("deficit", 0) > max_frame_deficit:
+                return False
+
+        return True
+
     async def connect(self):
         """|coro|
 
@@ -156,10 +647,15 @@ class Node:
         await self.bot.wait_until_ready()
 
         try:
-            self.websocket = await websockets.connect(uri=self.websocket_uri, extra_headers=self.headers)
+            self.websocket = await websockets.connect(uri=self.websocket_uri, extra_headers=self.headers,
+                                                    **self.websocket_options)
+            if self.send_queue.error is not None:
+                self.send_queue = _SendQueue(self.client.loop, self.send_queue_size)
             self.task = self.bot.loop.create_task(self.listen())
+            self.writer = self.bot.loop.create_task(self.write())
             self.client.nodes[self.identifier] = self
             self.available = True
+            self.client.metrics.inc("granitepy_node_connects_total", node=self.identifier)
 
             return self
 
@@ -170,29 +666,78 @@ class Node:
         except socket.gaierror:
             raise exceptions.NodeConnectionFailure(f"The Node '{self.identifier}' failed to connect.")
 
-    async def disconnect(self):
+    async def disconnect(self, *, concurrency: int = 10):
         """|coro|
 
         Disconnects this :class:`.Node` and destroys all its :class:`.Player`'s.
+
+        Parameters
+        ----------
+        concurrency: Optional[:class:`int`]
+            The amount of Players destroyed at the same time.
         """
 
-        for player in self.players.copy().values():
-            await player.destroy()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def destroy(player):
+            async with semaphore:
+                await player.destroy()
+
+        await asyncio.gather(*[destroy(player) for player in list(self.players.values())], return_exceptions=True)
 
         await self.websocket.close()
-        del self.client.nodes[self.identifier]
+        self.client.nodes.pop(self.identifier, None)
         self.available = False
+        self.send_queue.close(exceptions.NodeNotAvailable(f"The node '{self.identifier}' is not currently available."))
         self.task.cancel()
+        self.writer.cancel()
+
+    async def drain(self, *, concurrency: int = 10, migrate: bool = True):
+        """|coro|
+
+        Stops new :class:`.Player`'s from being created on this :class:`.Node`, moves its Players to other Nodes
+        and disconnects it once it is empty. Players that can not be moved are destroyed.
+
+        Parameters
+        ----------
+        concurrency: Optional[:class:`int`]
+            The amount of Players moved at the same time.
+        migrate: Optional[:class:`bool`]
+            Whether or not to move Players to other Nodes. If False they are destroyed.
+        """
+
+        self.draining = True
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def handoff(player):
+            async with semaphore:
+
+                try:
+                    node = self.client.get_node(shard_id=player.shard_id, region=player.region) if migrate else None
+                except exceptions.NoNodesAvailable:
+                    node = None
+
+                if node is None:
+                    await player.destroy()
+                else:
+                    await player.change_node(node)
 
-    async def get_tracks(self, query: str):
+        await asyncio.gather(*[handoff(player) for player in list(self.players.values())], return_exceptions=True)
+        await self.disconnect(concurrency=concurrency)
+
+    async def get_tracks(self, query: str, *, pipeline: TrackPipeline = None):
         """|coro|
 
         Returns a list of tracks or a playlist.
 
+        If the Client has a :attr:`.Client.track_cache`, results are cached per query and pipeline.
+
         Parameters
         ----------
         query: :class:`str`
             The search to preform. Can be a link or a general search term.
+        pipeline: Optional[:class:`.TrackPipeline`]
+            Post-processing to apply when the result is a list of Tracks.
 
         Returns
         -------
@@ -200,11 +745,60 @@ class Node:
             Either a list of Tracks or a Playlist.
         """
 
-        async with self.client.session.get(url=f"{self.rest_uri}/loadtracks", params=dict(identifier=query),
-                                           headers={"Authorization": self.password}) as response:
-            data = await response.json()
+        cache = self.client.track_cache
+        key = (query, pipeline.key if pipeline else None)
+
+        if cache is None:
+            return await self._process_tracks(query, pipeline)
+
+        try:
+            result = cache.get(key)
+        except KeyError:
+            pass
+        else:
+            self.client.metrics.inc("granitepy_track_cache_hits_total")
+            return result
+
+        task = cache.pending.get(key)
+        if task is None:
+            self.client.metrics.inc("granitepy_track_cache_misses_total")
+
+            task = self.bot.loop.create_task(self._process_tracks(query, pipeline))
+            cache.pending[key] = task
+
+            def done(finished):
+                cache.pending.pop(key, None)
+                if not finished.cancelled() and finished.exception() is None:
+                    cache.set(key, finished.result())
+
+            task.add_done_callback(done)
+        else:
+            self.client.metrics.inc("granitepy_track_cache_shared_total")
+
+        # Shielded so a cancelled caller does not cancel the request for the others waiting on it.
+        return _copy_result(await asyncio.shield(task))
+
+    async def _process_tracks(self, query: str, pipeline: TrackPipeline = None):
+
+        result = await self._load_tracks(query)
+
+        if pipeline is not None and isinstance(result, list):
+            result = pipeline(result)
+
+        return result
+
+    async def _load_tracks(self, query: str):
+
+        start_time = time.perf_counter()
+
+        with self.client.tracer.span("node.get_tracks", node=self.identifier, query=query):
+            async with self.client.session.get(url=f"{self.rest_uri}/loadtracks", params=dict(identifier=query),
+                                               headers={"Authorization": self.password}) as response:
+                data = await response.json()
 
         load_type = data.get("loadType")
+        self.client.metrics.observe("granitepy_get_tracks_seconds", time.perf_counter() - start_time,
+                                    node=self.identifier, load_type=load_type)
 
         if not load_type:
             raise exceptions.TrackLoadError("There was an error while trying to load this track.")
@@ -220,3 +814,52 @@ class Node:
 
         elif load_type == "SEARCH_RESULT" or load_type == "TRACK_LOADED":
             return [objects.Track(track_id=track["track"], info=track["info"]) for track in data["tracks"]]
+
+    async def stream_tracks(self, query: str):
+        """
+        Loads tracks like :meth:`Node.get_tracks`, but yields each :class:`.Track` as soon as it has been received
+        instead of waiting for the whole response. Useful for large playlists, as the first track can be played while
+        the rest are still arriving.
+
+        .. code-block:: python3
+
+            async for track in node.stream_tracks(query):
+                ...
+
+        Parameters
+        ----------
+        query: :class:`str`
+            The search to preform. Can be a link or a general search term.
+
+        Raises
+        ------
+        :exc:`.TrackLoadError`
+            There was an error while loading the tracks. This is raised once the response has been fully received.
+
+        Yields
+        ------
+        :class:`.Track`
+            The loaded Tracks, in order.
+        """
+
+        parser = _TrackStreamParser()
+
+        with self.client.tracer.span("node.stream_tracks", node=self.identifier, query=query):
+            async with self.client.session.get(url=f"{self.rest_uri}/loadtracks", params=dict(identifier=query),
+                                               headers={"Authorization": self.password}) as response:
+                async for chunk in response.content.iter_any():
+                    for track in parser.feed(chunk):
+                        yield objects.Track(track_id=track["track"], info=track["info"])
+
+        try:
+            data = parser.close()
+        except ValueError:
+            raise exceptions.TrackLoadError("There was an error while trying to load this track.")
+
+        load_type = data.get("loadType")
+
+        if not load_type:
+            raise exceptions.TrackLoadError("There was an error while trying to load this track.")
+
+        elif load_type == "LOAD_FAILED":
+            raise exceptions.TrackLoadError(f"There was an error of severity '{data['severity']}' while loading tracks.\n\n{data['cause']}")
@@ -1,3 +1,8 @@
+import base64
+import re
+import struct
+
+from . import exceptions
 
 
 class Track:
@@ -122,3 +127,210 @@ class Metadata:
 
     def __repr__(self):
         return f"<GraniteMetadata version={self.version!r} region={self.node_region!r} id={self.node_id} enabled_sources={self.enabled_sources}>"
+
+
+_TRACK_INFO_VERSIONED = 1
+_TRACK_INFO_VERSION = 2
+
+_INT = struct.Struct(">i")
+_LONG = struct.Struct(">q")
+_SHORT = struct.Struct(">H")
+
+# Characters that java's modified UTF-8 encodes differently from standard UTF-8.
+_MODIFIED_UTF = re.compile("[\x00\U00010000-\U0010FFFF]")
+
+
+class _TrackReader:
+
+    __slots__ = ("data", "offset")
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.offset = 0
+
+    def read_byte(self):
+        value = self.data[self.offset]
+        self.offset += 1
+        return value
+
+    def read_bool(self):
+        return self.read_byte() != 0
+
+    def read_int(self):
+        value, = _INT.unpack_from(self.data, self.offset)
+        self.offset += 4
+        return value
+
+    def read_long(self):
+        value, = _LONG.unpack_from(self.data, self.offset)
+        self.offset += 8
+        return value
+
+    def read_utf(self):
+
+        length, = _SHORT.unpack_from(self.data, self.offset)
+        raw = self.data[self.offset + 2:self.offset + 2 + length]
+        self.offset += 2 + length
+
+        try:
+            return raw.decode("utf-8")
+        except UnicodeDecodeError:
+            # Modified UTF-8 encodes null as two bytes and supplementary characters as surrogate pairs.
+            text = raw.replace(b"\xc0\x80", b"\x00").decode("utf-8", "surrogatepass")
+            return text.encode("utf-16", "surrogatepass").decode("utf-16")
+
+    def read_nullable_utf(self):
+        return self.read_utf() if self.read_bool() else None
+
+
+def _write_utf(text: str):
+
+    if _MODIFIED_UTF.search(text) is None:
+        data = text.encode("utf-8")
+    else:
+        data = bytearray()
+        for character in text:
+            code_point = ord(character)
+            if code_point == 0:
+                data += b"\xc0\x80"
+            elif code_point > 0xFFFF:
+                code_point -= 0x10000
+                data += chr(0xD800 + (code_point >> 10)).encode("utf-8", "surrogatepass")
+                data += chr(0xDC00 + (code_point & 0x3FF)).encode("utf-8", "surrogatepass")
+            else:
+                data += character.encode("utf-8")
+
+    if len(data) > 0xFFFF:
+        raise exceptions.TrackDecodeError("Track fields can not be longer than 65535 bytes when encoded.")
+
+    return _SHORT.pack(len(data)) + bytes(data)
+
+
+def decode_track(track_id: str):
+    """
+    Decodes a base64 track id into a :class:`.Track` locally, without asking a node.
+
+    The decoded Track's info also contains ``sourceName``, the name of the source the track was loaded from.
+
+    Parameters
+    ----------
+    track_id: :class:`str`
+        The base64 encoded track id.
+
+    Raises
+    ------
+    :exc:`.TrackDecodeError`
+        The track id could not be decoded.
+
+    Returns
+    -------
+    :class:`.Track`
+        The decoded Track.
+    """
+
+    try:
+        reader = _TrackReader(base64.b64decode(track_id))
+
+        header = reader.read_int()
+        flags = (header >> 30) & 0b11
+        version = reader.read_byte() if flags & _TRACK_INFO_VERSIONED else 1
+
+        title = reader.read_utf()
+        author = reader.read_utf()
+        length = reader.read_long()
+        identifier = reader.read_utf()
+        is_stream = reader.read_bool()
+        uri = reader.read_nullable_utf() if version >= 2 else None
+
+        if version >= 3:
+            reader.read_nullable_utf()
+            reader.read_nullable_utf()
+
+        source = reader.read_utf()
+
+        # Sources can write extra fields before the position, which is always the last value.
+        position, = _LONG.unpack_from(reader.data, len(reader.data) - 8)
+
+    except (ValueError, IndexError, struct.error, UnicodeDecodeError) as error:
+        raise exceptions.TrackDecodeError(f"The track '{track_id}' could not be decoded.") from error
+
+    info = {
+        "title": title,
+        "author": author,
+        "length": length,
+        "identifier": identifier,
+        "uri": uri,
+        "isStream": is_stream,
+        "isSeekable": not is_stream,
+        "position": position,
+        "sourceName": source
+    }
+
+    return Track(track_id=track_id, info=info)
+
+
+def decode_tracks(track_ids: list):
+    """
+    Decodes many base64 track ids into :class:`.Track`'s locally. See :func:`decode_track`.
+
+    Parameters
+    ----------
+    track_ids: :class:`list` [:class:`str`]
+        The base64 encoded track ids.
+
+    Raises
+    ------
+    :exc:`.TrackDecodeError`
+        A track id could not be decoded.
+
+    Returns
+    -------
+    :class:`list` [:class:`.Track`]
+        The decoded Tracks, in the same order as the ids.
+    """
+
+    return [decode_track(track_id) for track_id in track_ids]
+
+
+def encode_track(info: dict, source: str = None):
+    """
+    Encodes track info into a base64 track id that andesite can play.
+
+    Parameters
+    ----------
+    info: :class:`dict`
+        The track info, using the same keys as :attr:`.Track.info`.
+    source: Optional[:class:`str`]
+        The name of the source the track is from, such as ``youtube``. If none the ``sourceName`` from the info is used.
+
+    Raises
+    ------
+    :exc:`.TrackDecodeError`
+        The track info could not be encoded.
+
+    Returns
+    -------
+    :class:`str`
+        The base64 encoded track id.
+    """
+
+    source = source if source else info.get("sourceName")
+    if not source:
+        raise exceptions.TrackDecodeError("A source is required to encode a track.")
+
+    uri = info.get("uri")
+
+    body = b"".join((
+        bytes((_TRACK_INFO_VERSION,)),
+        _write_utf(info.get("title") or ""),
+        _write_utf(info.get("author") or ""),
+        _LONG.pack(info.get("length") or 0),
+        _write_utf(info.get("identifier") or ""),
+        b"\x01" if info.get("isStream") else b"\x00",
+        b"\x01" + _write_utf(uri) if uri is not None else b"\x00",
+        _write_utf(source),
+        _LONG.pack(info.get("position") or 0)
+    ))
+
+    header = _INT.pack((_TRACK_INFO_VERSIONED << 30) | len(body))
+    return base64.b64encode(header + body).decode()
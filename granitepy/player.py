@@ -1,3 +1,5 @@
+import asyncio
+import logging
 import time
 
 import discord
@@ -6,6 +8,9 @@ from . import exceptions
 from . import filters
 from . import objects
 from .node import Node
+from .search import TrackPipeline
+
+log = logging.getLogger(__name__)
 
 
 class Player:
@@ -30,8 +35,29 @@ class Player:
         A dict of the currently set filters.
     current: :class:`.Track`
         The track that is currently playing. Can be None if nothing is playing.
+    last_active: :class:`float`
+        The unix timestamp of when the Player was created or last known to be playing.
+    update_interval: Optional[:class:`float`]
+        The minimum time in seconds between handled player updates for this Player. If none the Node's
+        :attr:`.Node.player_update_interval` is used. Set this to 0 while a Player's position is being displayed
+        to handle every update. :attr:`position` is still estimated between updates.
+    debounce: Optional[:class:`float`]
+        A window in seconds to collect :meth:`seek`, :meth:`set_volume` and :meth:`set_filter` calls in. The first
+        call schedules a send after the window and the calls after it replace its value, so only the latest is
+        sent. The setters return the new local value right away. If none every call is sent immediately.
+
+    Players use ``__slots__`` and only keep the parsed fields of andesite's updates, to stay small when there
+    are tens of thousands of them. Subclasses that do not define ``__slots__`` can add attributes as usual.
+    Set ``retain_state = True`` on a subclass to also keep the raw state dict of the last update, which
+    :attr:`player_state` then returns.
     """
 
+    __slots__ = ("node", "guild", "bot", "voice_channel", "volume", "paused", "filters", "current", "session_id",
+                 "voice_event", "voice_ready", "last_voice_update", "voice_span", "last_position", "last_update",
+                 "time", "last_active", "update_interval", "debounce", "pending_updates", "raw_state", "__weakref__")
+
+    retain_state = False
+
     def __init__(self, node: Node, guild: discord.Guild, **kwargs):
 
         self.node = node
@@ -45,11 +71,19 @@ class Player:
         self.filters = None
         self.current = None
 
-        self.voice_state = {}
-        self.player_state = {}
+        self.session_id = None
+        self.voice_event = None
+        self.voice_ready = None
+        self.last_voice_update = None
+        self.voice_span = None
         self.last_position = 0
         self.last_update = 0
         self.time = 0
+        self.last_active = time.time()
+        self.update_interval = None
+        self.debounce = None
+        self.pending_updates = None
+        self.raw_state = None
 
     def __repr__(self):
         return f"<GranitePlayer is_connected={self.is_connected} is_playing={self.is_playing}>"
@@ -67,6 +101,46 @@ class Player:
         difference = (time.time() * 1000) - self.last_update
         return min(self.last_position + difference, self.current.length)
 
+    @property
+    def voice_state(self):
+        """:class:`dict`: The voice session id and voice server update received from discord so far."""
+
+        voice_state = {}
+        if self.session_id is not None:
+            voice_state["sessionId"] = self.session_id
+        if self.voice_event is not None:
+            voice_state["event"] = self.voice_event
+
+        return voice_state
+
+    @property
+    def player_state(self):
+        """:class:`dict`: The player state from the last player update, rebuilt from the parsed fields unless
+        ``retain_state`` is set."""
+
+        if self.raw_state is not None:
+            return self.raw_state
+
+        return {
+            "time": self.time,
+            "position": self.last_position,
+            "paused": self.paused,
+            "volume": self.volume,
+            "filters": self.filters
+        }
+
+    @property
+    def region(self):
+        """Optional[:class:`str`]: The Node region for this Player's voice server. See :meth:`Client.get_region`."""
+        if self.voice_event is None:
+            return None
+        return self.node.client.get_region(self.voice_event.get("endpoint"))
+
+    @property
+    def shard_id(self):
+        """:class:`int`: The id of the shard this Player's guild belongs to."""
+        return self.guild.shard_id
+
     @property
     def is_connected(self):
         """:class:`bool`: Whether or not the Player is connected to a Voice Channel."""
@@ -84,36 +158,96 @@ class Player:
 
     async def update_state(self, state: dict):
 
-        self.player_state = state
+        if self.retain_state:
+            self.raw_state = state
 
-        self.last_update = time.time() * 1000
-        self.last_position = state.get("position", 0)
+        # Values waiting to be sent by debounce are newer than the ones andesite reports.
+        pending = self.pending_updates or ()
+
+        if "seek" not in pending:
+            self.last_update = time.time() * 1000
+            self.last_position = state.get("position", 0)
         self.time = state.get("time", 0)
-        self.volume = state.get("volume", 100)
+        if "volume" not in pending:
+            self.volume = state.get("volume", 100)
         self.paused = state.get("paused", False)
-        self.filters = state.get("filters", self.filters)
+        if "filters" not in pending:
+            self.filters = state.get("filters", self.filters)
+
+        if self.current is not None and not self.paused:
+            self.last_active = time.time()
 
     async def voice_server_update(self, data: dict):
 
-        self.voice_state.update({"event": data})
+        old_region = self.region
+        self.voice_event = data
+
+        region = self.region
+        if region is not None and region != old_region and self.node.region != region:
+            # The guild's voice server moved to another region, follow it when a Node is available there.
+            try:
+                node = self.node.client.get_node(shard_id=self.shard_id, region=region)
+            except exceptions.NoNodesAvailable:
+                node = None
+
+            if node is not None and node.region == region:
+                await self.change_node(node)
+                return
 
-        if {"sessionId", "event"} == self.voice_state.keys():
-            await self.node.send(op="voice-server-update", guildId=str(self.guild.id), **self.voice_state)
+        await self.send_voice_update()
 
     async def voice_state_update(self, data: dict):
 
-        self.voice_state.update({"sessionId": data["session_id"]})
+        channel_id = data["channel_id"]
 
-        if data['channel_id'] is None:
+        # Mute and deafen changes keep the same session and channel, andesite does not need to know about them.
+        # Moving with connect sets the channel before discord confirms it, so the handshake still completes here
+        # once andesite has the voice connection for this session.
+        if channel_id is not None and self.voice_channel is not None and int(channel_id) == self.voice_channel.id \
+                and data["session_id"] == self.session_id:
+            if self.last_voice_update is not None and self.last_voice_update[0] == self.session_id:
+                self._complete_voice_handshake()
+            return
+
+        self.session_id = data["session_id"]
+
+        if channel_id is None:
             self.voice_channel = None
-            self.voice_state.clear()
+            self.session_id = None
+            self.voice_event = None
+            self.last_voice_update = None
+        else:
+            self.voice_channel = self.bot.get_channel(int(channel_id))
+
+        await self.send_voice_update()
+
+    async def send_voice_update(self):
+
+        if self.session_id is None or self.voice_event is None:
+            return
+
+        voice_update = (self.session_id, self.voice_event.get("endpoint"), self.voice_event.get("token"))
+
+        if voice_update != self.last_voice_update:
+            await self.node.send(op="voice-server-update", guildId=str(self.guild.id), sessionId=self.session_id,
+                                 event=self.voice_event)
+            self.last_voice_update = voice_update
+            self.node.client.metrics.inc("granitepy_voice_updates_total", node=self.node.identifier)
         else:
-            self.voice_channel = self.bot.get_channel(int(data["channel_id"]))
+            self.node.client.metrics.inc("granitepy_voice_updates_skipped_total", node=self.node.identifier)
+
+        self._complete_voice_handshake()
+
+    def _complete_voice_handshake(self):
 
-        if {"sessionId", "event"} == self.voice_state.keys():
-            await self.node.send(op="voice-server-update", guildId=str(self.guild.id), **self.voice_state)
+        if self.voice_span is not None:
+            self.node.client.tracer.end(self.voice_span)
+            self.voice_span = None
 
-    async def get_tracks(self, query: str):
+        if self.voice_ready is not None and not self.voice_ready.done():
+            self.voice_ready.set_result(None)
+
+    async def get_tracks(self, query: str, *, pipeline: TrackPipeline = None):
         """|coro|
 
         Shortcut for :meth:`Node.get_tracks`
@@ -122,6 +256,8 @@ class Player:
         ----------
         query: :class:`str`
             The search to preform. Can be a link or a general search term.
+        pipeline: Optional[:class:`.TrackPipeline`]
+            Post-processing to apply when the result is a list of Tracks.
 
         Returns
         -------
@@ -129,9 +265,26 @@ class Player:
             Either a list of Tracks or a Playlist.
         """
 
-        return await self.node.get_tracks(query)
+        return await self.node.get_tracks(query, pipeline=pipeline)
+
+    def stream_tracks(self, query: str):
+        """
+        Shortcut for :meth:`Node.stream_tracks`
+
+        Parameters
+        ----------
+        query: :class:`str`
+            The search to preform. Can be a link or a general search term.
+
+        Returns
+        -------
+        AsyncIterator[:class:`.Track`]
+            An async iterator of the loaded Tracks.
+        """
+
+        return self.node.stream_tracks(query)
 
-    async def connect(self, voice_channel: discord.VoiceChannel):
+    async def connect(self, voice_channel: discord.VoiceChannel, *, wait: bool = False, timeout: float = 10):
         """|coro|
 
         Connects the Bot to the given Voice Channel.
@@ -140,14 +293,84 @@ class Player:
         ----------
         voice_channel: :class:`discord.VoiceChannel`
             The discord Voice Channel to connect to.
+        wait: Optional[:class:`bool`]
+            Whether or not to wait until the voice connection has been forwarded to andesite before returning.
+        timeout: Optional[:class:`float`]
+            The time in seconds to wait for the voice connection if ``wait`` is True.
+
+        Raises
+        ------
+        :exc:`.PlayerConnectionTimeout`
+            The voice connection was not completed within the given timeout.
         """
 
         self.voice_channel = voice_channel
 
+        if self.voice_span is None:
+            self.voice_span = self.node.client.tracer.span("player.voice_handshake", node=self.node.identifier, guild_id=self.guild.id)
+            self.node.client.tracer.start(self.voice_span)
+
+        if wait and (self.voice_ready is None or self.voice_ready.done()):
+            self.voice_ready = self.bot.loop.create_future()
+
         # noinspection PyProtectedMember
         ws = self.bot._connection._get_websocket(self.guild.id)
         await ws.voice_state(self.guild.id, str(voice_channel.id))
 
+        if not wait:
+            return
+
+        try:
+            await asyncio.wait_for(asyncio.shield(self.voice_ready), timeout=timeout)
+        except asyncio.TimeoutError:
+            error = exceptions.PlayerConnectionTimeout(f"The voice connection for guild '{self.guild.id}' timed out.")
+
+            # The next connect starts a new span, so this attempt's duration is not counted towards it.
+            if self.voice_span is not None:
+                self.node.client.tracer.end(self.voice_span, error=error)
+                self.voice_span = None
+
+            raise error
+
+    def _debounce_update(self, op: str, **data):
+
+        if self.pending_updates is None:
+            self.pending_updates = {}
+
+        pending = self.pending_updates.get(op)
+        if pending is not None:
+            # Filters of different types are sent together, so only the same filter type replaces an earlier one.
+            pending[1].update(data)
+            return
+
+        handle = self.bot.loop.call_later(self.debounce, self._flush_update, op)
+        self.pending_updates[op] = [handle, data]
+
+    def _flush_update(self, op: str):
+
+        _, data = self.pending_updates.pop(op)
+        self.bot.loop.create_task(self._send_update(op, data))
+
+    async def _send_update(self, op: str, data: dict):
+
+        try:
+            await self.node.send(op=op, guildId=str(self.guild.id), **data)
+        except exceptions.NodeNotAvailable:
+            pass
+        except Exception as error:
+            # Nobody awaits a debounced send, so the error is only logged.
+            log.warning("Sending the debounced %s update for guild %s failed: %r", op, self.guild.id, error)
+
+    def _cancel_updates(self, *ops: str):
+
+        if not self.pending_updates:
+            return
+
+        for op in ops or list(self.pending_updates):
+            pending = self.pending_updates.pop(op, None)
+            if pending is not None:
+                pending[0].cancel()
+
     async def stop(self):
         """|coro|
 
@@ -155,6 +378,7 @@ class Player:
         """
 
         self.current = None
+        self._cancel_updates("seek")
 
         await self.node.send(op="stop", guildId=str(self.guild.id))
 
@@ -178,10 +402,54 @@ class Player:
         """
 
         del self.node.players[self.guild.id]
+        self.node._report_players()
+        self._cancel_updates()
+        self.node.client.metrics.inc("granitepy_players_destroyed_total", node=self.node.identifier)
 
         await self.disconnect()
         await self.node.send(op="destroy", guildId=str(self.guild.id))
 
+    async def change_node(self, node: Node):
+        """|coro|
+
+        Moves the Player to another :class:`.Node`, resuming the current Track at its current position.
+
+        Parameters
+        ----------
+        node: :class:`.Node`
+            The Node to move the Player to.
+        """
+
+        if node is self.node:
+            return
+
+        old_node = self.node
+        position = int(self.position)
+
+        if old_node.available:
+            await old_node.send(op="destroy", guildId=str(self.guild.id))
+
+        old_node.players.pop(self.guild.id, None)
+        node.players[self.guild.id] = self
+        old_node._report_players()
+        node._report_players()
+        self.node = node
+
+        # The new node has never seen the voice connection, so it has to be forwarded again.
+        self.last_voice_update = None
+        await self.send_voice_update()
+
+        if self.current is not None:
+            await self.node.send(op="play", guildId=str(self.guild.id), track=self.current.track_id, start=position)
+        if self.volume != 100:
+            await self.node.send(op="volume", guildId=str(self.guild.id), volume=self.volume)
+        if self.filters:
+            await self.node.send(op="filters", guildId=str(self.guild.id), **self.filters)
+        if self.paused:
+            await self.node.send(op="pause", guildId=str(self.guild.id), pause=True)
+
+        self.node.client.metrics.inc("granitepy_players_moved_total", node=node.identifier)
+
     async def play(self, track: objects.Track, start_position: int = 0):
         """|coro|
 
@@ -204,8 +472,12 @@ class Player:
                              guildId=str(self.guild.id),
                              track=track.track_id,
                              start=start_position)
+        self._cancel_updates("seek")
 
         self.current = track
+        self.last_active = time.time()
+        self.last_position = start_position
+        self.last_update = time.time() * 1000
         return self.current
 
     async def seek(self, position: int):
@@ -227,6 +499,12 @@ class Player:
         if position < 0 or position > self.current.length:
             raise exceptions.TrackInvalidPosition(f"Seek position must be between 0 and the track length")
 
+        if self.debounce:
+            self._debounce_update("seek", position=position)
+            self.last_position = position
+            self.last_update = time.time() * 1000
+            return self.position
+
         await self.node.send(op="seek",
                              guildId=str(self.guild.id),
                              position=position)
@@ -270,6 +548,11 @@ class Player:
             The Players new volume.
         """
 
+        if self.debounce:
+            self._debounce_update("volume", volume=volume)
+            self.volume = volume
+            return self.volume
+
         await self.node.send(op="volume",
                              guildId=str(self.guild.id),
                              volume=volume)
@@ -293,6 +576,10 @@ class Player:
             The Filter that was added to the Player.
         """
 
+        if self.debounce:
+            self._debounce_update("filters", **filter_type.payload)
+            return filter_type
+
         await self.node.send(op="filters", **filter_type.payload, guildId=str(self.guild.id))
         return filter_type
 
@@ -0,0 +1,145 @@
+import asyncio
+import glob
+import json
+import os
+import time
+
+
+class Registry:
+    """
+    Base class for sharing Node load and Player placement between the processes of a bot cluster.
+
+    Every process publishes a snapshot of its own Nodes and Players under its cluster id, and fetches the snapshots
+    of every process to account for the whole cluster when choosing Nodes. A snapshot is a dict containing ``nodes``,
+    a mapping of Node identifiers to their player count, ``players``, a mapping of :class:`discord.Guild` ids to the
+    identifier of the Node their Player is on, and ``time``, the unix timestamp it was published at.
+    """
+
+    async def publish(self, cluster_id: str, snapshot: dict):
+        """|coro|
+
+        Publishes the snapshot of a process.
+
+        Parameters
+        ----------
+        cluster_id: :class:`str`
+            The id of the publishing process.
+        snapshot: :class:`dict`
+            The snapshot of the process.
+        """
+
+        raise NotImplementedError
+
+    async def fetch(self):
+        """|coro|
+
+        Fetches the snapshots of every process.
+
+        Returns
+        -------
+        :class:`dict` [:class:`str`, :class:`dict`]
+            A mapping of cluster ids to their latest snapshot.
+        """
+
+        raise NotImplementedError
+
+    async def remove(self, cluster_id: str):
+        """|coro|
+
+        Removes the snapshot of a process.
+
+        Parameters
+        ----------
+        cluster_id: :class:`str`
+            The id of the process to remove.
+        """
+
+        raise NotImplementedError
+
+
+class MemoryRegistry(Registry):
+    """
+    A :class:`.Registry` that keeps snapshots in memory. It only shares state between Clients in the same process
+    that are given the same instance.
+    """
+
+    def __init__(self):
+        self.snapshots = {}
+
+    def __repr__(self):
+        return f"<GraniteMemoryRegistry cluster_count={len(self.snapshots)}>"
+
+    async def publish(self, cluster_id: str, snapshot: dict):
+        self.snapshots[cluster_id] = snapshot
+
+    async def fetch(self):
+        return dict(self.snapshots)
+
+    async def remove(self, cluster_id: str):
+        self.snapshots.pop(cluster_id, None)
+
+
+class FileRegistry(Registry):
+    """
+    A :class:`.Registry` that stores one json file per process in a shared directory.
+
+    Attributes
+    ----------
+    path: :class:`str`
+        The directory the snapshots are stored in.
+    ttl: :class:`float`
+        The time in seconds after which a snapshot that has not been updated is ignored.
+    """
+
+    def __init__(self, path: str, *, ttl: float = 60):
+
+        self.path = path
+        self.ttl = ttl
+
+        os.makedirs(self.path, exist_ok=True)
+
+    def __repr__(self):
+        return f"<GraniteFileRegistry path={self.path!r} ttl={self.ttl}>"
+
+    def _write(self, cluster_id: str, snapshot: dict):
+
+        file = os.path.join(self.path, f"{cluster_id}.json")
+        with open(f"{file}.tmp", "w") as f:
+            json.dump(snapshot, f)
+
+        # Replacing the file is atomic, so other processes never read a partially written snapshot.
+        os.replace(f"{file}.tmp", file)
+
+    def _read(self):
+
+        snapshots = {}
+        for file in glob.glob(os.path.join(self.path, "*.json")):
+
+            try:
+                with open(file) as f:
+                    snapshot = json.load(f)
+            except (OSError, ValueError):
+                continue
+
+            if time.time() - snapshot.get("time", 0) > self.ttl:
+                continue
+
+            snapshots[os.path.basename(file)[:-5]] = snapshot
+
+        return snapshots
+
+    def _delete(self, cluster_id: str):
+
+        try:
+            os.remove(os.path.join(self.path, f"{cluster_id}.json"))
+        except FileNotFoundError:
+            pass
+
+    async def publish(self, cluster_id: str, snapshot: dict):
+        await asyncio.get_event_loop().run_in_executor(None, self._write, cluster_id, snapshot)
+
+    async def fetch(self):
+        return await asyncio.get_event_loop().run_in_executor(None, self._read)
+
+    async def remove(self, cluster_id: str):
+        await asyncio.get_event_loop().run_in_executor(None, self._delete, cluster_id)
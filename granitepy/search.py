@@ -0,0 +1,171 @@
+import collections
+import copy
+import time
+
+
+def _copy_result(result):
+    """Returns a copy of a get_tracks result that callers can change without affecting the cached one."""
+
+    if isinstance(result, list):
+        return list(result)
+
+    if result is not None:
+        result = copy.copy(result)
+        result.tracks = list(result.tracks)
+
+    return result
+
+
+class TrackPipeline:
+    """
+    Post-processing applied to the list of Tracks returned by :meth:`Node.get_tracks`.
+    Steps run in the order of the parameters below.
+
+    When a :class:`.TrackCache` is in use, the processed list is cached, so the pipeline only runs once per distinct
+    query.
+
+    Attributes
+    ----------
+    exclude_streams: :class:`bool`
+        Whether or not to drop streams.
+    min_length: Optional[:class:`int`]
+        The minimum track length in milliseconds.
+    max_length: Optional[:class:`int`]
+        The maximum track length in milliseconds.
+    dedupe: :class:`bool`
+        Whether or not to drop tracks with an identifier already in the results.
+    target_length: Optional[:class:`int`]
+        A length in milliseconds to rank tracks by. Tracks closest to it come first.
+    limit: Optional[:class:`int`]
+        The maximum number of tracks to return.
+    """
+
+    def __init__(self, *, exclude_streams: bool = False, min_length: int = None, max_length: int = None,
+                 dedupe: bool = False, target_length: int = None, limit: int = None):
+
+        self.exclude_streams = exclude_streams
+        self.min_length = min_length
+        self.max_length = max_length
+        self.dedupe = dedupe
+        self.target_length = target_length
+        self.limit = limit
+
+    def __repr__(self):
+        return f"<GraniteTrackPipeline key={self.key}>"
+
+    @property
+    def key(self):
+        """:class:`tuple`: A hashable representation of this pipeline, used in cache keys."""
+        return self.exclude_streams, self.min_length, self.max_length, self.dedupe, self.target_length, self.limit
+
+    def __call__(self, tracks: list):
+
+        if self.exclude_streams:
+            tracks = [track for track in tracks if not track.is_stream]
+
+        if self.min_length is not None:
+            tracks = [track for track in tracks if (track.length or 0) >= self.min_length]
+
+        if self.max_length is not None:
+            tracks = [track for track in tracks if (track.length or 0) <= self.max_length]
+
+        if self.dedupe:
+            seen = set()
+            unique = []
+            for track in tracks:
+                if track.identifier not in seen:
+                    seen.add(track.identifier)
+                    unique.append(track)
+            tracks = unique
+
+        if self.target_length is not None:
+            tracks = sorted(tracks, key=lambda track: abs((track.length or 0) - self.target_length))
+
+        if self.limit is not None:
+            tracks = tracks[:self.limit]
+
+        return tracks
+
+
+class TrackCache:
+    """
+    A least recently used cache of :meth:`Node.get_tracks` results.
+
+    Concurrent requests for a query that is not cached share one request to the node. Every caller gets its own copy
+    of the result, so changing a returned list or :attr:`.Playlist.tracks` does not affect the cached result.
+
+    Attributes
+    ----------
+    max_size: :class:`int`
+        The maximum number of results kept.
+    ttl: :class:`float`
+        The time in seconds a result is kept for.
+    """
+
+    def __init__(self, max_size: int = 1000, ttl: float = 300):
+
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self.results = collections.OrderedDict()
+        self.pending = {}
+
+    def __repr__(self):
+        return f"<GraniteTrackCache size={len(self.results)} max_size={self.max_size} ttl={self.ttl}>"
+
+    def __len__(self):
+        return len(self.results)
+
+    def get(self, key):
+        """
+        Returns the cached result for the given key.
+
+        Parameters
+        ----------
+        key
+            The cache key.
+
+        Raises
+        ------
+        :exc:`KeyError`
+            There is no result cached for the key, or it has expired.
+
+        Returns
+        -------
+        Optional[Union[:class:`list` [:class:`.Track`], :class:`.Playlist`]]
+            The cached result.
+        """
+
+        expires_at, result = self.results[key]
+
+        if time.monotonic() >= expires_at:
+            del self.results[key]
+            raise KeyError(key)
+
+        self.results.move_to_end(key)
+        return _copy_result(result)
+
+    def set(self, key, result):
+        """
+        Caches a result.
+
+        Parameters
+        ----------
+        key
+            The cache key.
+        result: Optional[Union[:class:`list` [:class:`.Track`], :class:`.Playlist`]]
+            The result to cache.
+        """
+
+        self.results[key] = (time.monotonic() + self.ttl, result)
+        self.results.move_to_end(key)
+
+        while len(self.results) > self.max_size:
+            self.results.popitem(last=False)
+
+    def clear(self):
+        """
+        Removes every cached result.
+        """
+
+        self.results.clear()
@@ -0,0 +1,135 @@
+import time
+
+
+class Span:
+    """
+    A timed operation reported to a :class:`.Tracer`. Spans can be used as context managers.
+
+    Attributes
+    ----------
+    tracer: :class:`.Tracer`
+        The Tracer this Span reports to.
+    name: :class:`str`
+        The name of the operation, for example ``node.get_tracks``.
+    tags: :class:`dict`
+        Extra information about the operation such as the ``guild_id`` and ``node`` identifier.
+    start_time: :class:`float`
+        The :func:`time.perf_counter` value when the Span started.
+    end_time: Optional[:class:`float`]
+        The :func:`time.perf_counter` value when the Span ended. Will be None if the Span has not ended.
+    error: Optional[:class:`Exception`]
+        The error the operation raised, if any.
+    """
+
+    __slots__ = ("tracer", "name", "tags", "start_time", "end_time", "error")
+
+    def __init__(self, tracer, name: str, tags: dict):
+
+        self.tracer = tracer
+        self.name = name
+        self.tags = tags
+
+        self.start_time = None
+        self.end_time = None
+        self.error = None
+
+    def __repr__(self):
+        return f"<GraniteSpan name={self.name!r} duration={self.duration} tags={self.tags}>"
+
+    def __enter__(self):
+        return self.tracer.start(self)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.tracer.end(self, error=exc_value)
+
+    @property
+    def duration(self):
+        """Optional[:class:`float`]: The duration of the Span in seconds. Will be None if the Span has not ended."""
+
+        if self.end_time is None:
+            return None
+
+        return self.end_time - self.start_time
+
+
+class Tracer:
+    """
+    Reports the start and end of granitepy operations to user provided hooks.
+
+    Node ops, rest calls, voice handshakes and event dispatches are traced. Pass an instance as ``tracer`` to
+    :class:`.Client` to attach a tracer. The hooks are called with the :class:`.Span`.
+
+    Attributes
+    ----------
+    on_start: Optional[Callable[[:class:`.Span`], None]]
+        Called when a Span starts.
+    on_end: Optional[Callable[[:class:`.Span`], None]]
+        Called when a Span ends.
+    """
+
+    def __init__(self, on_start=None, on_end=None):
+
+        self.on_start = on_start
+        self.on_end = on_end
+
+    def __repr__(self):
+        return f"<GraniteTracer on_start={self.on_start!r} on_end={self.on_end!r}>"
+
+    def span(self, name: str, **tags):
+        """
+        Creates a :class:`.Span` that starts when entered and ends when exited.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the operation.
+        **tags
+            Extra information about the operation.
+
+        Returns
+        -------
+        :class:`.Span`
+            The new Span.
+        """
+
+        return Span(self, name, tags)
+
+    def start(self, span: Span):
+        """
+        Starts a :class:`.Span` and calls :attr:`on_start`.
+
+        Parameters
+        ----------
+        span: :class:`.Span`
+            The Span to start.
+
+        Returns
+        -------
+        :class:`.Span`
+            The started Span.
+        """
+
+        span.start_time = time.perf_counter()
+
+        if self.on_start is not None:
+            self.on_start(span)
+
+        return span
+
+    def end(self, span: Span, error: Exception = None):
+        """
+        Ends a :class:`.Span` and calls :attr:`on_end`.
+
+        Parameters
+        ----------
+        span: :class:`.Span`
+            The Span to end.
+        error: Optional[:class:`Exception`]
+            The error the operation raised, if any.
+        """
+
+        span.end_time = time.perf_counter()
+        span.error = error
+
+        if self.on_end is not None:
+            self.on_end(span)
@@ -0,0 +1,75 @@
+import asyncio
+import json
+import types
+
+import discord
+import pytest
+from discord.ext import commands
+
+import granitepy
+from granitepy.metrics import Metrics
+from granitepy.node import Node
+from granitepy.tracing import Tracer
+
+
+class SlowWebsocket:
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.sent = []
+
+    async def send(self, data: str):
+        await asyncio.sleep(self.delay)
+        self.sent.append(json.loads(data))
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+
+    tasks = asyncio.all_tasks(loop)
+    for task in tasks:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+    loop.close()
+
+
+class Gateway:
+
+    def __init__(self):
+        self.voice_states = []
+
+    async def voice_state(self, guild_id: int, channel_id: str):
+        self.voice_states.append((guild_id, channel_id))
+
+
+def make_node(loop, **kwargs):
+
+    gateway = Gateway()
+    channels = {channel_id: types.SimpleNamespace(id=channel_id) for channel_id in (10, 11)}
+    connection = types.SimpleNamespace(_get_websocket=lambda guild_id: gateway)
+    bot = types.SimpleNamespace(loop=loop, user=types.SimpleNamespace(id=1), _connection=connection,
+                                get_channel=channels.get, gateway=gateway)
+    client = types.SimpleNamespace(bot=bot, loop=loop, nodes={}, metrics=Metrics(), tracer=Tracer(),
+                                   get_region=lambda endpoint: None)
+
+    node = Node(client, host="127.0.0.1", port=0, password="", identifier="test", **kwargs)
+    node.websocket = SlowWebsocket()
+    node.available = True
+    node.task = loop.create_task(asyncio.sleep(3600))
+    node.writer = loop.create_task(node.write())
+    client.nodes[node.identifier] = node
+    return node
+
+
+def make_client(loop, registry=None):
+
+    bot = commands.Bot(command_prefix="!", loop=loop, intents=discord.Intents.none())
+    bot._ready.set()
+    bot._connection.user = types.SimpleNamespace(id=1)
+    return granitepy.Client(bot, loop=loop, registry=registry, cluster_id="test", registry_interval=0.01)
@@ -0,0 +1,97 @@
+import asyncio
+import types
+
+import granitepy
+from granitepy import exceptions
+
+from conftest import make_client
+
+
+def test_node_retries_continue_after_unexpected_errors(loop):
+
+    client = make_client(loop)
+    attempts = []
+
+    async def create_node(**kwargs):
+        attempts.append(kwargs["identifier"])
+        if len(attempts) < 3:
+            raise RuntimeError("unexpected")
+        return "node"
+
+    client.create_node = create_node
+
+    async def run():
+        await client.create_nodes([{"identifier": "retry"}], retry_delay=0.01)
+        await asyncio.sleep(0.1)
+        await client.session.close()
+
+    loop.run_until_complete(run())
+
+    assert len(attempts) == 3
+    assert not client.node_retries
+
+
+def test_voice_update_errors_are_handled(loop):
+
+    client = make_client(loop)
+    errors = []
+    loop.set_exception_handler(lambda loop, context: errors.append(context))
+
+    class FailingPlayer:
+        guild = types.SimpleNamespace(id=1)
+
+        async def voice_server_update(self, data: dict):
+            raise exceptions.NodeNotAvailable("The node 'test' is not currently available.")
+
+    async def run():
+        await client._voice_update(FailingPlayer(), "VOICE_SERVER_UPDATE", {})
+        await client.session.close()
+
+    loop.run_until_complete(run())
+
+    assert not errors
+
+
+def test_player_gauge_is_reported_without_a_registry(loop):
+
+    client = make_client(loop)
+    client.metrics = granitepy.Collector()
+
+    node = granitepy.Node(client, host="127.0.0.1", port=0, password="", identifier="test")
+    node.available = True
+    client.nodes[node.identifier] = node
+
+    for guild_id in range(3):
+        client.get_player(types.SimpleNamespace(id=guild_id, shard_id=0))
+
+    loop.run_until_complete(client.session.close())
+
+    assert client.registry_task is None
+    assert client.metrics.gauges["granitepy_players"][(("node", "test"),)] == 3
+
+
+def test_new_players_follow_the_placement_of_other_processes(loop):
+
+    client = make_client(loop)
+
+    for identifier in ("a", "b"):
+        node = granitepy.Node(client, host="127.0.0.1", port=0, password="", identifier=identifier)
+        node.available = True
+        client.nodes[identifier] = node
+
+    # Node b is busier, so only the placement in the registry can choose it.
+    client.cluster_loads = {"b": 10}
+    client.cluster_players = {5: "b"}
+
+    placed = client.get_player(types.SimpleNamespace(id=5, shard_id=0))
+    balanced = client.get_player(types.SimpleNamespace(id=6, shard_id=0))
+
+    client.nodes["b"].draining = True
+    client.cluster_players[7] = "b"
+    drained = client.get_player(types.SimpleNamespace(id=7, shard_id=0))
+
+    loop.run_until_complete(client.session.close())
+
+    assert placed.node.identifier == "b"
+    assert balanced.node.identifier == "a"
+    assert drained.node.identifier == "a"
@@ -0,0 +1,76 @@
+import json
+import random
+
+import pytest
+
+from granitepy.node import _TrackStreamParser
+
+BODY = json.dumps({
+    "loadType": "PLAYLIST_LOADED",
+    "playlistInfo": {"name": 'a "tracks" [playlist] {with} \\ brackets', "selectedTrack": -1},
+    "tracks": [
+        {"track": "QAAA", "info": {"title": 'quote " and backslash \\', "author": "[]{}", "length": 1}},
+        {"track": "QAAB", "info": {"title": '\\"tracks\\": [', "author": "café ♫ \U0001F3B5", "length": 2}},
+        {"track": "QAAC", "info": {"title": "}]", "author": "\\\\", "length": 3}}
+    ],
+    "cause": None,
+    "severity": None
+}, ensure_ascii=False).encode()
+
+
+def parse(chunks):
+
+    parser = _TrackStreamParser()
+    tracks = []
+    for chunk in chunks:
+        tracks.extend(parser.feed(chunk))
+
+    return tracks, parser.close()
+
+
+def split(data: bytes, indexes):
+
+    indexes = sorted(set(indexes))
+    return [data[start:end] for start, end in zip([0] + indexes, indexes + [len(data)])]
+
+
+def expected():
+
+    result = json.loads(BODY)
+    return result.pop("tracks"), dict(result, tracks=[])
+
+
+def test_parse_single_chunk():
+    assert parse([BODY]) == expected()
+
+
+@pytest.mark.parametrize("index", range(1, len(BODY)))
+def test_parse_split_at_every_byte(index):
+    assert parse(split(BODY, [index])) == expected()
+
+
+def test_parse_random_chunks():
+
+    generator = random.Random(0)
+    for _ in range(300):
+        indexes = [generator.randrange(1, len(BODY)) for _ in range(generator.randrange(1, 40))]
+        assert parse(split(BODY, indexes)) == expected()
+
+
+def test_parse_byte_by_byte():
+    assert parse([BODY[index:index + 1] for index in range(len(BODY))]) == expected()
+
+
+def test_no_tracks():
+
+    body = json.dumps({"loadType": "NO_MATCHES", "tracks": [], "playlistInfo": None}).encode()
+    assert parse(split(body, [5, 20])) == ([], json.loads(body))
+
+
+def test_truncated_body_raises():
+
+    parser = _TrackStreamParser()
+    parser.feed(BODY[:BODY.index(b"QAAB")])
+
+    with pytest.raises(ValueError):
+        parser.close()
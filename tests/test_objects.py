@@ -0,0 +1,111 @@
+import base64
+import struct
+
+import pytest
+
+from granitepy import exceptions, objects
+
+# A youtube track id encoded by lavaplayer.
+TRACK_ID = (
+    "QAAAjQIAJVJpY2sgQXN0bGV5IC0gTmV2ZXIgR29ubmEgR2l2ZSBZb3UgVXAADlJpY2tBc3RsZXlWRVZPAAAAAAADPCAAC2RRdzR3OVdnWGNRAAEAK2h0"
+    "dHBzOi8vd3d3LnlvdXR1YmUuY29tL3dhdGNoP3Y9ZFF3NHc5V2dYY1EAB3lvdXR1YmUAAAAAAAAAAA=="
+)
+
+
+def utf(data: bytes):
+    return struct.pack(">H", len(data)) + data
+
+
+def build_track(version, position=0, extra=b""):
+
+    body = b"".join((
+        utf(b"title"),
+        utf(b"author"),
+        struct.pack(">q", 1000),
+        utf(b"identifier"),
+        b"\x00",
+        b"\x01" + utf(b"https://example.com") if version >= 2 else b"",
+        b"\x01" + utf(b"artwork") + b"\x00" if version >= 3 else b"",
+        utf(b"http"),
+        extra,
+        struct.pack(">q", position)
+    ))
+
+    if version == 1:
+        header = struct.pack(">i", len(body))
+    else:
+        body = bytes((version,)) + body
+        header = struct.pack(">i", (1 << 30) | len(body))
+
+    return base64.b64encode(header + body).decode()
+
+
+def test_decode_lavaplayer_track():
+
+    track = objects.decode_track(TRACK_ID)
+
+    assert track.info == {
+        "title": "Rick Astley - Never Gonna Give You Up",
+        "author": "RickAstleyVEVO",
+        "length": 212000,
+        "identifier": "dQw4w9WgXcQ",
+        "uri": "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "isStream": False,
+        "isSeekable": True,
+        "position": 0,
+        "sourceName": "youtube"
+    }
+    assert objects.encode_track(track.info) == TRACK_ID
+
+
+@pytest.mark.parametrize("version", [1, 2, 3])
+def test_decode_versions(version):
+
+    info = objects.decode_track(build_track(version)).info
+
+    assert (info["title"], info["author"], info["identifier"]) == ("title", "author", "identifier")
+    assert info["length"] == 1000
+    assert info["sourceName"] == "http"
+    assert info["uri"] == (None if version == 1 else "https://example.com")
+
+
+def test_decode_position_after_source_fields():
+
+    # Sources can write their own fields between the source name and the position.
+    info = objects.decode_track(build_track(2, position=4321, extra=b"\x01" + utf(b"mp3"))).info
+
+    assert info["position"] == 4321
+    assert info["sourceName"] == "http"
+
+
+@pytest.mark.parametrize("title", ["null \x00 byte", "emoji \U0001F3B5", "café ♫"])
+def test_modified_utf_round_trip(title):
+
+    info = dict(objects.decode_track(TRACK_ID).info, title=title, position=5000)
+    track_id = objects.encode_track(info)
+
+    assert objects.decode_track(track_id).info == info
+
+
+def test_modified_utf_encoding():
+
+    info = dict(objects.decode_track(TRACK_ID).info, title="\x00\U0001F3B5")
+    data = base64.b64decode(objects.encode_track(info))
+
+    # Java writes null as two bytes and supplementary characters as a utf-8 encoded surrogate pair.
+    assert utf(b"\xc0\x80\xed\xa0\xbc\xed\xbe\xb5") in data
+
+
+def test_encode_requires_source():
+
+    info = dict(objects.decode_track(TRACK_ID).info, sourceName=None)
+
+    with pytest.raises(exceptions.TrackDecodeError):
+        objects.encode_track(info)
+
+
+@pytest.mark.parametrize("track_id", ["", "not a track", TRACK_ID[:40]])
+def test_decode_invalid_track(track_id):
+
+    with pytest.raises(exceptions.TrackDecodeError):
+        objects.decode_track(track_id)
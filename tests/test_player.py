@@ -0,0 +1,180 @@
+import asyncio
+import types
+
+import pytest
+
+from granitepy import exceptions
+from granitepy.metrics import Collector
+from granitepy.player import Player
+from granitepy.tracing import Tracer
+
+from conftest import make_node
+
+
+def make_player(loop):
+
+    node = make_node(loop)
+    player = Player(node, types.SimpleNamespace(id=1, shard_id=0))
+    node.players[player.guild.id] = player
+    return node, player
+
+
+def test_moving_channels_with_the_same_session_completes(loop):
+
+    async def run():
+        node, player = make_player(loop)
+
+        await player.voice_state_update({"channel_id": "10", "session_id": "session"})
+        await player.voice_server_update({"endpoint": "us-east1.discord.media:443", "token": "token"})
+
+        # Moving keeps the session and discord sends no new voice server update.
+        connect = loop.create_task(player.connect(node.bot.get_channel(11), wait=True, timeout=1))
+        await asyncio.sleep(0)
+        await player.voice_state_update({"channel_id": "11", "session_id": "session"})
+
+        await connect
+        return node, player
+
+    node, player = loop.run_until_complete(run())
+
+    assert player.voice_channel.id == 11
+    assert player.voice_span is None
+    assert [frame["op"] for frame in node.websocket.sent] == ["voice-server-update"]
+
+
+def test_mute_before_the_voice_server_update_does_not_complete(loop):
+
+    async def run():
+        node, player = make_player(loop)
+
+        connect = loop.create_task(player.connect(node.bot.get_channel(10), wait=True, timeout=1))
+        await asyncio.sleep(0)
+        await player.voice_state_update({"channel_id": "10", "session_id": "session"})
+        # A mute toggle repeats the channel and session before discord sends the voice server update.
+        await player.voice_state_update({"channel_id": "10", "session_id": "session"})
+        await asyncio.sleep(0.01)
+        completed_early = connect.done()
+
+        await player.voice_server_update({"endpoint": "us-east1.discord.media:443", "token": "token"})
+        await connect
+        return node, completed_early
+
+    node, completed_early = loop.run_until_complete(run())
+
+    assert not completed_early
+    assert [frame["op"] for frame in node.websocket.sent] == ["voice-server-update"]
+
+
+def test_region_change_without_nodes_stays_on_the_current_node(loop):
+
+    def get_node(shard_id=None, region=None):
+        raise exceptions.NoNodesAvailable("There are no Nodes available.")
+
+    async def run():
+        node, player = make_player(loop)
+        node.client.get_region = lambda endpoint: "us-east"
+        node.client.get_node = get_node
+
+        await player.voice_state_update({"channel_id": "10", "session_id": "session"})
+        await player.voice_server_update({"endpoint": "us-east1.discord.media:443", "token": "token"})
+        return node, player
+
+    node, player = loop.run_until_complete(run())
+
+    assert player.node is node
+    assert [frame["op"] for frame in node.websocket.sent] == ["voice-server-update"]
+
+
+def test_debounced_volume_is_kept_until_sent(loop):
+
+    async def run():
+        node, player = make_player(loop)
+        player.debounce = 0.05
+
+        await player.set_volume(50)
+        await player.update_state({"position": 0, "time": 0, "volume": 100, "paused": False})
+        volume = player.volume
+
+        await asyncio.sleep(0.1)
+        return node, volume
+
+    node, volume = loop.run_until_complete(run())
+
+    assert volume == 50
+    assert node.websocket.sent == [{"op": "volume", "guildId": "1", "volume": 50}]
+
+
+def test_debounced_send_errors_are_handled(loop):
+
+    class ClosedWebsocket:
+        async def send(self, data: str):
+            raise ConnectionResetError("closed")
+
+    errors = []
+    loop.set_exception_handler(lambda loop, context: errors.append(context))
+
+    async def run():
+        node, player = make_player(loop)
+        node.websocket = ClosedWebsocket()
+        player.debounce = 0.01
+
+        await player.set_volume(50)
+        await asyncio.sleep(0.05)
+
+    loop.run_until_complete(run())
+
+    assert not errors
+
+
+def test_raw_state_is_only_kept_when_opted_in(loop):
+
+    class RetainingPlayer(Player):
+        retain_state = True
+
+    state = {"position": 1000, "time": 1, "volume": 50, "paused": False, "filters": {}, "extra": True}
+
+    async def run():
+        node = make_node(loop)
+        player = Player(node, types.SimpleNamespace(id=1, shard_id=0))
+        retaining = RetainingPlayer(node, types.SimpleNamespace(id=2, shard_id=0))
+
+        await player.update_state(state)
+        await retaining.update_state(state)
+        return player, retaining
+
+    player, retaining = loop.run_until_complete(run())
+
+    assert "extra" not in player.player_state
+    assert retaining.player_state is state
+
+
+def test_destroy_reports_the_player_gauge(loop):
+
+    async def run():
+        node, player = make_player(loop)
+        node.client.metrics = Collector()
+        await player.destroy()
+        return node
+
+    node = loop.run_until_complete(run())
+
+    assert node.client.metrics.gauges["granitepy_players"][(("node", "test"),)] == 0
+
+
+def test_connect_timeout_ends_the_handshake_span(loop):
+
+    ended = []
+
+    async def run():
+        node, player = make_player(loop)
+        node.client.tracer = Tracer(on_end=ended.append)
+
+        with pytest.raises(exceptions.PlayerConnectionTimeout):
+            await player.connect(node.bot.get_channel(10), wait=True, timeout=0.01)
+        return player
+
+    player = loop.run_until_complete(run())
+
+    assert player.voice_span is None
+    assert len(ended) == 1
+    assert isinstance(ended[0].error, exceptions.PlayerConnectionTimeout)
@@ -0,0 +1,45 @@
+import asyncio
+
+import granitepy
+
+from conftest import make_client
+
+
+class FailingRegistry(granitepy.MemoryRegistry):
+
+    def __init__(self):
+        super().__init__()
+        self.failures = 1
+
+    async def publish(self, cluster_id: str, snapshot: dict):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("registry unavailable")
+        await super().publish(cluster_id, snapshot)
+
+
+def test_registry_is_not_synced_without_a_registry(loop):
+
+    client = make_client(loop)
+
+    assert client.registry_task is None
+    loop.run_until_complete(client.session.close())
+
+
+def test_registry_sync_survives_errors_and_stops(loop):
+
+    registry = FailingRegistry()
+    client = make_client(loop, registry)
+
+    async def run():
+        await asyncio.sleep(0.05)
+        synced = "test" in registry.snapshots
+
+        await client.stop_registry()
+        await client.session.close()
+        return synced
+
+    assert loop.run_until_complete(run())
+    assert registry.failures == 0
+    assert client.registry_task is None
+    assert "test" not in registry.snapshots
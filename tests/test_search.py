@@ -0,0 +1,74 @@
+import asyncio
+
+from granitepy import objects
+from granitepy.search import TrackCache, TrackPipeline
+
+from conftest import make_node
+
+
+def make_track(index: int, length: int = 180000):
+    info = {"title": f"Track {index}", "identifier": str(index), "length": length, "isStream": False}
+    return {"track": objects.encode_track(info, source="http"), "info": info}
+
+
+def make_cached_node(loop, result):
+
+    node = make_node(loop)
+    node.client.track_cache = TrackCache()
+    loads = []
+
+    async def load_tracks(query: str):
+        loads.append(query)
+        await asyncio.sleep(0.01)
+        return result()
+
+    node._load_tracks = load_tracks
+    return node, loads
+
+
+def test_concurrent_misses_share_one_request(loop):
+
+    calls = []
+
+    class CountingPipeline(TrackPipeline):
+        def __call__(self, tracks: list):
+            calls.append(len(tracks))
+            return super().__call__(tracks)
+
+    def result():
+        return [objects.Track(track_id=track["track"], info=track["info"]) for track in map(make_track, range(5))]
+
+    node, loads = make_cached_node(loop, result)
+    pipeline = CountingPipeline(limit=3)
+
+    async def run():
+        results = await asyncio.gather(*[node.get_tracks("query", pipeline=pipeline) for _ in range(5)])
+        results.append(await node.get_tracks("query", pipeline=pipeline))
+        return results
+
+    results = loop.run_until_complete(run())
+
+    assert loads == ["query"]
+    assert calls == [5]
+    assert all(len(result) == 3 for result in results)
+    assert len({id(result) for result in results}) == len(results)
+
+
+def test_cached_playlists_are_copied(loop):
+
+    def result():
+        return objects.Playlist({"name": "Playlist"}, [make_track(index) for index in range(3)])
+
+    node, loads = make_cached_node(loop, result)
+
+    async def run():
+        first = await node.get_tracks("playlist")
+        first.tracks.pop()
+        return first, await node.get_tracks("playlist")
+
+    first, second = loop.run_until_complete(run())
+
+    assert loads == ["playlist"]
+    assert first is not second
+    assert len(first.tracks) == 2
+    assert len(second.tracks) == 3
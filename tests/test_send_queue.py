@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from granitepy import exceptions
+from granitepy.node import _SendQueue
+
+from conftest import make_node
+
+
+def test_filters_are_merged_per_type(loop):
+
+    async def run():
+        node = make_node(loop)
+        await asyncio.gather(
+            node.send(op="play", guildId="0", track="", start=0),
+            node.send(op="filters", guildId="1", timescale={"speed": 1.5}),
+            node.send(op="filters", guildId="1", karaoke={"level": 1}),
+            node.send(op="filters", guildId="1", timescale={"speed": 2})
+        )
+        return node.websocket.sent
+
+    sent = loop.run_until_complete(run())
+
+    filters = [frame for frame in sent if frame["op"] == "filters"]
+    assert filters == [{"op": "filters", "guildId": "1", "timescale": {"speed": 2}, "karaoke": {"level": 1}}]
+
+
+def test_volume_is_replaced(loop):
+
+    async def run():
+        node = make_node(loop)
+        await asyncio.gather(*[node.send(op="volume", guildId="1", volume=volume) for volume in (10, 20, 30)])
+        return node.websocket.sent
+
+    sent = loop.run_until_complete(run())
+
+    assert [frame["volume"] for frame in sent] == [10, 30]
+
+
+def test_stop_keeps_pause(loop):
+
+    async def run():
+        node = make_node(loop)
+        await asyncio.gather(
+            node.send(op="play", guildId="0", track="", start=0),
+            node.send(op="seek", guildId="1", position=0),
+            node.send(op="pause", guildId="1", pause=True),
+            node.send(op="stop", guildId="1")
+        )
+        return node.websocket.sent
+
+    sent = loop.run_until_complete(run())
+
+    assert [frame["op"] for frame in sent] == ["play", "stop", "pause"]
+
+
+def test_destroy_drops_every_queued_frame(loop):
+
+    async def run():
+        node = make_node(loop)
+        await asyncio.gather(
+            node.send(op="play", guildId="0", track="", start=0),
+            node.send(op="seek", guildId="1", position=0),
+            node.send(op="pause", guildId="1", pause=True),
+            node.send(op="volume", guildId="1", volume=50),
+            node.send(op="volume", guildId="2", volume=50),
+            node.send(op="destroy", guildId="1")
+        )
+        return node.websocket.sent
+
+    sent = loop.run_until_complete(run())
+
+    assert [(frame["op"], frame["guildId"]) for frame in sent] == [("play", "0"), ("destroy", "1"), ("volume", "2")]
+
+
+def test_disconnect_fails_every_pending_send(loop):
+
+    async def run():
+        node = make_node(loop, send_queue_size=2)
+        sends = [loop.create_task(node.send(op="pause", guildId=str(guild_id), pause=True)) for guild_id in range(6)]
+
+        # Let the first frame go out directly, one reach the writer and the rest queue or wait for a slot.
+        await asyncio.sleep(0.001)
+        await node.disconnect()
+
+        done, pending = await asyncio.wait(sends, timeout=1)
+        return [task.exception() for task in done], pending
+
+    errors, pending = loop.run_until_complete(run())
+
+    assert not pending
+    assert all(error is None or isinstance(error, exceptions.NodeNotAvailable) for error in errors)
+    assert sum(isinstance(error, exceptions.NodeNotAvailable) for error in errors) == 5
+
+
+def test_send_after_close_raises(loop):
+
+    async def run():
+        queue = _SendQueue(loop, 1)
+        queue.close(exceptions.NodeNotAvailable("closed"))
+        await queue.put({"op": "volume", "guildId": "1", "volume": 10})
+
+    with pytest.raises(exceptions.NodeNotAvailable):
+        loop.run_until_complete(run())